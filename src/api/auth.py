@@ -61,6 +61,8 @@ def get_keycloak_config() -> dict:
 class TokenPayload(BaseModel):
     """Validated JWT token payload."""
 
+    model_config = {"frozen": True}
+
     sub: str  # Subject (user ID)
     email: str | None = None
     preferred_username: str | None = None
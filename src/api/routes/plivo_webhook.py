@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 
 from src.api.websocket.audio_stream import CallCapacityError, call_registry
 from src.config import Settings, get_settings
@@ -33,6 +33,7 @@ def get_plivo_service(settings: Settings = Depends(get_settings)) -> PlivoServic
 @router.post("/webhook/answer")
 async def plivo_answer_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     plivo: PlivoService = Depends(get_plivo_service),
     settings: Settings = Depends(get_settings),
 ) -> Response:
@@ -104,7 +105,7 @@ async def plivo_answer_webhook(
 
     # Pre-create session in registry (with capacity check)
     try:
-        await call_registry.create(
+        session, _ = await call_registry.create(
             call_info.call_uuid,
             business_id=business_id,
             caller_id_hash=caller_id_hash,
@@ -139,6 +140,9 @@ async def plivo_answer_webhook(
         content_type=content_type,
     )
 
+    # Connect to the LLM while Plivo sets up the stream and plays the greeting
+    background_tasks.add_task(session.warmup)
+
     logger.debug(f"Returning stream XML for {call_info.call_uuid}")
 
     return Response(
@@ -10,13 +10,16 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import json
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
 
+from src.api.auth import TokenPayload, decode_token
 from src.config import Settings, get_settings
 from src.core.pipeline import AudioSender, VoicePipeline
 from src.core.session import CallSession
@@ -30,6 +33,13 @@ logger: Any = get_logger(__name__)
 # System capacity limit to prevent overload
 MAX_CONCURRENT_CALLS = 10  # Adjust based on server resources (CPU, memory)
 
+# Verified WebSocket JWT payloads, keyed by digest of (call_id, token).
+# Plivo re-establishes the media leg on network blips; re-validating the same
+# token on every reconnect is wasted work. Entries never outlive the token.
+WS_AUTH_CACHE_TTL_SECONDS = 300
+WS_AUTH_CACHE_MAX_ENTRIES = 5000
+_ws_auth_cache: dict[bytes, tuple[float, TokenPayload]] = {}
+
 
 class CallCapacityError(Exception):
     """Raised when system is at maximum call capacity."""
@@ -217,15 +227,62 @@ class PlivoAudioSender(AudioSender):
             logger.error(f"Failed to clear audio: {e}")
 
 
+def authenticate_websocket(token: str, call_id: str) -> TokenPayload:
+    """Validate a WebSocket JWT, reusing the payload on reconnect.
+
+    The HTTP path (decode_token) is intentionally left uncached; only the
+    audio stream reconnects often enough to benefit.
+
+    Raises:
+        HTTPException: If the token is invalid or expired.
+    """
+    key = hashlib.blake2b(f"{call_id}:{token}".encode(), digest_size=16).digest()
+    now = time.time()
+
+    cached = _ws_auth_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if now < expires_at:
+            return payload
+        del _ws_auth_cache[key]
+
+    payload = decode_token(token)
+
+    expires_at = now + WS_AUTH_CACHE_TTL_SECONDS
+    if payload.exp is not None:
+        expires_at = min(expires_at, payload.exp)
+
+    if len(_ws_auth_cache) >= WS_AUTH_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order: evict the oldest entry in O(1)
+        del _ws_auth_cache[next(iter(_ws_auth_cache))]
+
+    _ws_auth_cache[key] = (expires_at, payload)
+    return payload
+
+
 async def audio_stream_endpoint(websocket: WebSocket, call_id: str) -> None:
     """Handle Plivo audio stream WebSocket connection.
 
     This is the main WebSocket endpoint for bidirectional audio.
+    A valid JWT is required in the ``token`` query parameter; connections
+    without one are rejected with a policy-violation close.
 
     Protocol:
     - Receives JSON messages with events: start, media, dtmf, stop
     - Sends JSON messages with event: media (audio chunks)
     """
+    token = websocket.query_params.get("token")
+    if not token:
+        logger.warning(f"WebSocket auth rejected for call {call_id}: missing token")
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    try:
+        authenticate_websocket(token, call_id)
+    except HTTPException as e:
+        logger.warning(f"WebSocket auth rejected for call {call_id}: {e.detail}")
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
     await websocket.accept()
     logger.info(f"WebSocket connected for call {call_id}")
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
@@ -74,6 +75,9 @@ class ReservationFlow:
     reservation repository to check availability and create bookings.
     """
 
+    # Minutes around the requested time to probe for alternatives, in order
+    _ALTERNATIVE_OFFSETS_MINUTES: tuple[int, ...] = (-60, -30, 30, 60, 90, 120)
+
     def __init__(
         self,
         repo: AsyncReservationRepository,
@@ -367,9 +371,7 @@ class ReservationFlow:
         base_time = datetime.strptime(extraction.reservation_time, "%H:%M")
 
         # Try times before and after the requested time
-        offsets = [-60, -30, 30, 60, 90, 120]  # minutes
-
-        for offset in offsets:
+        for offset in self._ALTERNATIVE_OFFSETS_MINUTES:
             if len(alternatives) >= num_alternatives:
                 break
 
@@ -416,24 +418,33 @@ class ReservationFlow:
 
     def _format_time(self, time_str: str) -> str:
         """Format time for display in responses."""
-        try:
-            hour = int(time_str.split(":")[0])
-            minute = int(time_str.split(":")[1])
-
-            if minute == 0:
-                minute_str = ""
-            elif minute == 30:
-                minute_str = " aadha"
-            else:
-                minute_str = f":{minute:02d}"
-
-            if hour >= 17:
-                display_hour = hour - 12 if hour > 12 else hour
-                return f"{display_hour}{minute_str} baje shaam"
-            elif hour >= 12:
-                display_hour = hour - 12 if hour > 12 else hour
-                return f"{display_hour}{minute_str} baje dopahar"
-            else:
-                return f"{hour}{minute_str} baje subah"
-        except (ValueError, IndexError):
-            return time_str
+        return _format_display_time(time_str)
+
+
+@lru_cache(maxsize=512)
+def _format_display_time(time_str: str) -> str:
+    """Format an HH:MM time as spoken Hinglish (e.g. "7 aadha baje shaam").
+
+    Cached: a business only ever sees a few dozen distinct slot times.
+    """
+    try:
+        hour = int(time_str.split(":")[0])
+        minute = int(time_str.split(":")[1])
+
+        if minute == 0:
+            minute_str = ""
+        elif minute == 30:
+            minute_str = " aadha"
+        else:
+            minute_str = f":{minute:02d}"
+
+        if hour >= 17:
+            display_hour = hour - 12 if hour > 12 else hour
+            return f"{display_hour}{minute_str} baje shaam"
+        elif hour >= 12:
+            display_hour = hour - 12 if hour > 12 else hour
+            return f"{display_hour}{minute_str} baje dopahar"
+        else:
+            return f"{hour}{minute_str} baje subah"
+    except (ValueError, IndexError):
+        return time_str
@@ -89,6 +89,10 @@ class CallSession:
         )
         self._extractor = ReservationExtractor(llm_service=self._llm)
 
+    async def warmup(self) -> None:
+        """Pre-connect the LLM client so the first turn skips connection setup."""
+        await self._llm.warmup()
+
     async def load_business_context(self) -> None:
         """Load live business settings from DB into the conversation context."""
         try:
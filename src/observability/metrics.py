@@ -5,7 +5,14 @@ Provides metrics for monitoring call quality, latency, and system health.
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge, Histogram, generate_latest
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 from prometheus_client.exposition import CONTENT_TYPE_LATEST
 
 # =============================================================================
@@ -170,13 +177,16 @@ def record_followup_missing_phone(business_id: str) -> None:
     FOLLOWUP_MISSING_PHONE.labels(business_id=business_id).inc()
 
 
-def get_metrics() -> bytes:
+def get_metrics(registry: CollectorRegistry = REGISTRY) -> bytes:
     """Generate Prometheus metrics output.
 
+    Args:
+        registry: Registry to expose (defaults to the global registry).
+
     Returns:
         Metrics in Prometheus text exposition format.
     """
-    return generate_latest()
+    return generate_latest(registry)
 
 
 def get_content_type() -> str:
@@ -1,5 +1,20 @@
-"""Transcript analysis services for internal QA."""
+"""Transcript analysis services for internal QA.
 
-from src.services.analysis.transcript_crew import TranscriptAnalysisCrew
+TranscriptAnalysisCrew is imported lazily (PEP 562) because crewai is
+slow to import and only the analysis worker needs it.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.analysis.transcript_crew import TranscriptAnalysisCrew
 
 __all__ = ["TranscriptAnalysisCrew"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "TranscriptAnalysisCrew":
+        from src.services.analysis.transcript_crew import TranscriptAnalysisCrew
+
+        return TranscriptAnalysisCrew
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,7 +11,6 @@ NOT real-time or caller-facing - this is admin tooling for continuous improvemen
 from __future__ import annotations
 
 import json
-import re
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -28,6 +27,14 @@ logger: Any = get_logger(__name__)
 MAX_TRANSCRIPT_TURNS = 50  # Maximum conversation turns to analyze
 MAX_TRANSCRIPT_CHARS = 12000  # ~3K tokens, safe for most models
 
+_JSON_DECODER = json.JSONDecoder()
+_EMPTY_JSON_LIST = "[]"
+
+
+def _word_set(text: str) -> frozenset[str]:
+    """Lowercased whitespace-separated words, for Jaccard matching."""
+    return frozenset(text.lower().split())
+
 
 @dataclass
 class ReviewedIssue:
@@ -64,6 +71,8 @@ class TranscriptReviewResult:
 
     def to_issues_json(self) -> str:
         """Serialize issues to JSON for database storage."""
+        if not self.issues:
+            return _EMPTY_JSON_LIST
         return json.dumps([
             {
                 "category": issue.category.value,
@@ -76,6 +85,8 @@ class TranscriptReviewResult:
 
     def to_suggestions_json(self) -> str:
         """Serialize suggestions to JSON for database storage."""
+        if not self.suggestions:
+            return _EMPTY_JSON_LIST
         return json.dumps([
             {
                 "category": suggestion.category.value,
@@ -145,11 +156,13 @@ class TranscriptAnalysisCrew:
         """
         truncated = False
 
-        # First limit: number of turns (lines)
-        lines = transcript.split('\n')
-        if len(lines) > MAX_TRANSCRIPT_TURNS:
-            lines = lines[-MAX_TRANSCRIPT_TURNS:]
-            transcript = '\n'.join(lines)
+        # First limit: number of turns (lines). Walk back to the newline that
+        # precedes the last MAX_TRANSCRIPT_TURNS lines and slice once.
+        if transcript.count('\n') >= MAX_TRANSCRIPT_TURNS:
+            cursor = len(transcript)
+            for _ in range(MAX_TRANSCRIPT_TURNS):
+                cursor = transcript.rfind('\n', 0, cursor)
+            transcript = transcript[cursor + 1:]
             truncated = True
 
         # Second limit: character count
@@ -494,6 +507,8 @@ You prioritize suggestions that will have the highest impact on customer satisfa
         """
         issues: list[ReviewedIssue] = []
         used_classifications: set[str] = set()
+        # Tokenize classifier descriptions once rather than per reviewer issue
+        classification_words = {key: _word_set(key) for key in classifications}
 
         for issue in reviewer_issues:
             description = issue.get("description", "")
@@ -507,7 +522,7 @@ You prioritize suggestions that will have the highest impact on customer satisfa
             if not classification:
                 # Try fuzzy matching
                 matched_key, classification = self._find_best_classification_match(
-                    description, classifications, used_classifications
+                    description, classifications, used_classifications, classification_words
                 )
 
             if matched_key:
@@ -550,12 +565,23 @@ You prioritize suggestions that will have the highest impact on customer satisfa
         description: str,
         classifications: dict[str, dict],
         used: set[str],
+        classification_words: dict[str, frozenset[str]] | None = None,
     ) -> tuple[str | None, dict | None]:
-        """Find best matching classification using word overlap similarity."""
+        """Find best matching classification using word overlap similarity.
+
+        Args:
+            description: Reviewer issue description to match
+            classifications: Classifier output keyed by description
+            used: Keys already matched to another issue
+            classification_words: Pre-tokenized keys; computed here if omitted
+        """
         if not description or not classifications:
             return None, None
 
-        desc_words = set(description.lower().split())
+        if classification_words is None:
+            classification_words = {key: _word_set(key) for key in classifications}
+
+        desc_words = _word_set(description)
         best_key = None
         best_score = 0.0
         best_match = None
@@ -564,14 +590,13 @@ You prioritize suggestions that will have the highest impact on customer satisfa
             if key in used:
                 continue
 
-            key_words = set(key.lower().split())
-            if not key_words:
+            key_words = classification_words[key]
+            if not key_words or desc_words.isdisjoint(key_words):
                 continue
 
             # Jaccard similarity: intersection / union
             intersection = len(desc_words & key_words)
-            union = len(desc_words | key_words)
-            score = intersection / union if union > 0 else 0.0
+            score = intersection / (len(desc_words) + len(key_words) - intersection)
 
             # Require at least 30% word overlap to consider a match
             if score > best_score and score >= 0.3:
@@ -583,13 +608,12 @@ You prioritize suggestions that will have the highest impact on customer satisfa
 
     def _extract_json_from_text(self, text: str) -> dict | None:
         """Extract JSON using proper decoder that handles nested structures."""
-        decoder = json.JSONDecoder()
-        # Find all potential JSON start positions
-        for match in re.finditer(r'\{', text):
+        # Try each "{" in turn; raw_decode starting at "{" can only yield a dict
+        start = text.find("{")
+        while start != -1:
             try:
-                obj, _ = decoder.raw_decode(text, match.start())
-                if isinstance(obj, dict):
-                    return obj
+                obj, _ = _JSON_DECODER.raw_decode(text, start)
+                return obj
             except json.JSONDecodeError:
-                continue
+                start = text.find("{", start + 1)
         return None
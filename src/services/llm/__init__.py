@@ -1,4 +1,10 @@
-"""LLM services (Groq)."""
+"""LLM services (Groq).
+
+GroqService is imported lazily (PEP 562) so that importing the protocol,
+rate limiter or exceptions does not pull in the groq SDK.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from src.services.llm.exceptions import (
     LLMAuthenticationError,
@@ -7,7 +13,6 @@ from src.services.llm.exceptions import (
     LLMRateLimitError,
     LLMServiceError,
 )
-from src.services.llm.groq import GroqService
 from src.services.llm.protocol import (
     ConversationContext,
     LLMService,
@@ -18,6 +23,9 @@ from src.services.llm.protocol import (
 from src.services.llm.rate_limiter import TokenBucketRateLimiter
 from src.services.llm.token_counter import estimate_llama_tokens
 
+if TYPE_CHECKING:
+    from src.services.llm.groq import GroqService
+
 __all__ = [
     # Protocol and types
     "LLMService",
@@ -37,3 +45,11 @@ __all__ = [
     "LLMAuthenticationError",
     "LLMContextTooLongError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GroqService":
+        from src.services.llm.groq import GroqService
+
+        return GroqService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,7 @@ This preserves low-latency streaming for voice while enabling structured extract
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum, auto
@@ -35,7 +36,7 @@ class ExtractionIntent(Enum):
     OPERATOR_REQUEST = auto()  # Wants to speak to human
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedReservation:
     """Structured reservation data extracted from conversation.
 
@@ -102,6 +103,23 @@ class ExtractedReservation:
         )
 
 
+# Maps LLM intent labels (short and long forms) to ExtractionIntent
+_INTENT_MAP: dict[str, ExtractionIntent] = {
+    "MAKE_RESERVATION": ExtractionIntent.MAKE_RESERVATION,
+    "MODIFY": ExtractionIntent.MODIFY_RESERVATION,
+    "MODIFY_RESERVATION": ExtractionIntent.MODIFY_RESERVATION,
+    "CANCEL": ExtractionIntent.CANCEL_RESERVATION,
+    "CANCEL_RESERVATION": ExtractionIntent.CANCEL_RESERVATION,
+    "INQUIRY": ExtractionIntent.INQUIRY,
+    "CHITCHAT": ExtractionIntent.CHITCHAT,
+    "OPERATOR": ExtractionIntent.OPERATOR_REQUEST,
+    "OPERATOR_REQUEST": ExtractionIntent.OPERATOR_REQUEST,
+}
+
+# Time formats accepted by ReservationExtractor._parse_time
+_HH_MM_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
+_HOUR_ONLY_RE = re.compile(r"^(\d{1,2})$")
+
 # Extraction system prompt
 EXTRACTION_SYSTEM_PROMPT = """You are analyzing a business voice conversation to extract booking details.
 
@@ -212,18 +230,7 @@ Extract reservation details from the USER's message. Output JSON only."""
         """Parse raw JSON extraction into ExtractedReservation."""
         # Parse intent
         intent_str = raw.get("intent", "CHITCHAT").upper()
-        intent_map = {
-            "MAKE_RESERVATION": ExtractionIntent.MAKE_RESERVATION,
-            "MODIFY": ExtractionIntent.MODIFY_RESERVATION,
-            "MODIFY_RESERVATION": ExtractionIntent.MODIFY_RESERVATION,
-            "CANCEL": ExtractionIntent.CANCEL_RESERVATION,
-            "CANCEL_RESERVATION": ExtractionIntent.CANCEL_RESERVATION,
-            "INQUIRY": ExtractionIntent.INQUIRY,
-            "CHITCHAT": ExtractionIntent.CHITCHAT,
-            "OPERATOR": ExtractionIntent.OPERATOR_REQUEST,
-            "OPERATOR_REQUEST": ExtractionIntent.OPERATOR_REQUEST,
-        }
-        intent = intent_map.get(intent_str, ExtractionIntent.CHITCHAT)
+        intent = _INTENT_MAP.get(intent_str, ExtractionIntent.CHITCHAT)
 
         # Parse party size
         party_size = None
@@ -320,14 +327,14 @@ Extract reservation details from the USER's message. Output JSON only."""
         time_str = time_str.strip()
 
         # Already in HH:MM format
-        if re.match(r"^\d{1,2}:\d{2}$", time_str):
-            parts = time_str.split(":")
-            hour = int(parts[0])
-            minute = int(parts[1])
+        match = _HH_MM_RE.match(time_str)
+        if match:
+            hour = int(match.group(1))
+            minute = int(match.group(2))
             return f"{hour:02d}:{minute:02d}"
 
         # Extract hour from strings like "7", "19"
-        match = re.match(r"^(\d{1,2})$", time_str)
+        match = _HOUR_ONLY_RE.match(time_str)
         if match:
             hour = int(match.group(1))
             # Assume PM for hours 1-6
@@ -340,7 +347,7 @@ Extract reservation details from the USER's message. Output JSON only."""
     async def validate(
         self,
         extracted: ExtractedReservation,
-        business_rules: dict,
+        business_rules: Mapping[str, Any],
     ) -> list[str]:
         """Validate extracted data against business rules.
 
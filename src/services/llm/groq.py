@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import time
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import groq
@@ -35,11 +36,57 @@ logger: Any = get_logger(__name__)
 GROQ_FREE_TIER_TPM = 6000  # Tokens per minute
 GROQ_FREE_TIER_RPM = 30  # Requests per minute
 
+# Connection warmup must never hold up a call
+WARMUP_TIMEOUT_SECONDS = 2.0
+
 # RAG injection limits - prevent prompt explosion
 MAX_KNOWLEDGE_TOKENS = 500  # ~375 words, fits within P50 latency budget
 BOOKING_BUSINESS_TYPES = {"restaurant", "clinic", "salon"}
 
 
+@lru_cache(maxsize=256)
+def _render_business_sections(
+    business_name: str,
+    operating_hours: tuple[tuple[str, str], ...],
+    booking_limits: tuple[int, int, int] | None,
+) -> str:
+    """Render the system prompt sections that depend only on business config.
+
+    Args:
+        business_name: Business display name
+        operating_hours: (day, rendered hours) pairs in display order
+        booking_limits: (min party, max phone party, total seats), or None
+            for businesses that don't take bookings
+
+    Returns:
+        Intro, operating hours and booking/service rules sections
+    """
+    hours_text = "\n".join(f"  - {day.capitalize()}: {hours}" for day, hours in operating_hours)
+
+    prompt = f"""You are a friendly voice assistant for {business_name}.
+
+## Operating Hours
+{hours_text}
+"""
+
+    if booking_limits is not None:
+        min_party, max_phone_party, total_seats = booking_limits
+        prompt += f"""
+## Booking Rules
+- Minimum party size: {min_party}
+- Maximum party size (phone): {max_phone_party} people
+- Total capacity: {total_seats} seats
+"""
+    else:
+        prompt += """
+## Service Rules
+- Use uploaded knowledge as the source of truth for services, pricing, and policies.
+- If a request needs staff action, offer escalation politely.
+"""
+
+    return prompt
+
+
 class GroqService:
     """Groq LLM service with async streaming and rate limiting."""
 
@@ -193,8 +240,7 @@ class GroqService:
         metadata: StreamMetadata,
     ) -> AsyncGenerator[str, None]:
         """Internal generator that populates metadata during streaming."""
-        start_time = time.perf_counter()
-        first_token_received = False
+        start_ns = time.perf_counter_ns()
 
         try:
             stream = await self.client.chat.completions.create(
@@ -206,17 +252,14 @@ class GroqService:
             )
 
             async for chunk in stream:  # type: ignore[union-attr]
-                pass  # chunk is ChatCompletionChunk
-
-                # Track first token latency
-                if not first_token_received:
-                    metadata.first_token_ms = (time.perf_counter() - start_time) * 1000
-                    first_token_received = True
-                    logger.debug(f"First token latency: {metadata.first_token_ms:.1f}ms")
-
-                # Extract content
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    # First token latency is taken at the first chunk carrying
+                    # text; the opening chunk usually holds only the role.
+                    if metadata.first_token_ms is None:
+                        metadata.first_token_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                        logger.debug(f"First token latency: {metadata.first_token_ms:.1f}ms")
+                    yield content
 
                 # Capture finish reason
                 if chunk.choices and chunk.choices[0].finish_reason:
@@ -260,37 +303,31 @@ class GroqService:
         """Build system prompt with injected context."""
         supports_bookings = context.business_type in BOOKING_BUSINESS_TYPES
 
-        # Format operating hours
-        hours_lines = []
-        for day, hours in context.operating_hours.items():
-            hours_lines.append(f"  - {day.capitalize()}: {hours}")
-        hours_text = "\n".join(hours_lines)
+        booking_limits = None
+        if supports_bookings:
+            rules = context.reservation_rules
+            booking_limits = (
+                rules.get("min_party_size", 1),
+                rules.get("max_phone_party_size", 10),
+                rules.get("total_seats", 40),
+            )
+
+        # Business-level sections come first and are cached; per-turn
+        # details follow so the prompt keeps a stable prefix across turns.
+        # Hours saved via the admin API are dicts, which aren't hashable;
+        # stringify them here (as the prompt renders them) for the cache key.
+        prompt = _render_business_sections(
+            context.business_name,
+            tuple((day, str(hours)) for day, hours in context.operating_hours.items()),
+            booking_limits,
+        )
 
         # Format current datetime
         dt_text = context.current_datetime.strftime("%A, %B %d, %Y at %I:%M %p")
-
-        prompt = f"""You are a friendly voice assistant for {context.business_name}.
-
+        prompt += f"""
 ## Current Information
 - Current date/time: {dt_text} ({context.timezone})
 - Business type: {context.business_type}
-
-## Operating Hours
-{hours_text}
-"""
-
-        if supports_bookings:
-            prompt += f"""
-## Booking Rules
-- Minimum party size: {context.reservation_rules.get('min_party_size', 1)}
-- Maximum party size (phone): {context.reservation_rules.get('max_phone_party_size', 10)} people
-- Total capacity: {context.reservation_rules.get('total_seats', 40)} seats
-"""
-        else:
-            prompt += """
-## Service Rules
-- Use uploaded knowledge as the source of truth for services, pricing, and policies.
-- If a request needs staff action, offer escalation politely.
 """
 
         if context.current_capacity is not None:
@@ -383,15 +420,10 @@ class GroqService:
 
     def _format_messages(self, system_prompt: str, messages: list[Message]) -> list[dict]:
         """Format messages for Groq API."""
-        api_messages = [{"role": "system", "content": system_prompt}]
-
-        for msg in messages:
-            api_messages.append({
-                "role": msg.role.value,
-                "content": msg.content,
-            })
-
-        return api_messages
+        return [
+            {"role": "system", "content": system_prompt},
+            *({"role": msg.role.value, "content": msg.content} for msg in messages),
+        ]
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for rate limiting."""
@@ -408,6 +440,21 @@ class GroqService:
                     pass
         return 60.0  # Default to 60 seconds
 
+    async def warmup(self) -> None:
+        """Open the HTTP connection to Groq ahead of the first completion.
+
+        Lists models (no tokens consumed) so DNS, TCP and TLS setup happen
+        while the caller hears the greeting rather than on the first turn.
+        Failures are logged and ignored; stream_chat will simply connect
+        on demand.
+        """
+        try:
+            await self.client.with_options(
+                timeout=WARMUP_TIMEOUT_SECONDS, max_retries=0
+            ).models.list()
+        except Exception as e:
+            logger.debug(f"Groq warmup failed: {e}")
+
     async def health_check(self) -> bool:
         """Check if Groq API is reachable."""
         try:
@@ -9,6 +9,27 @@ from src.logging_config import get_logger
 
 logger: Any = get_logger(__name__)
 
+NS_PER_MINUTE = 60_000_000_000
+
+
+def _refill_bucket(
+    level: int,
+    clock_ns: int,
+    now_ns: int,
+    ns_per_unit: int,
+    capacity: int,
+) -> tuple[int, int]:
+    """Add whole units earned since clock_ns, capped at capacity.
+
+    Returns:
+        The new bucket level and the advanced clock. A full bucket resets
+        the clock to now so idle time isn't banked beyond capacity.
+    """
+    added = (now_ns - clock_ns) // ns_per_unit
+    if level + added >= capacity:
+        return capacity, now_ns
+    return level + added, clock_ns + added * ns_per_unit
+
 
 @dataclass
 class TokenBucketRateLimiter:
@@ -22,16 +43,23 @@ class TokenBucketRateLimiter:
     tokens_per_minute: int = 6000
     requests_per_minute: int = 30
 
-    # Internal state
-    _token_bucket: float = field(default=0.0, init=False, repr=False)
-    _request_bucket: float = field(default=0.0, init=False, repr=False)
-    _last_refill: float = field(default_factory=time.monotonic, init=False, repr=False)
+    # Internal state. Buckets hold whole units; each bucket has its own
+    # monotonic_ns clock that only advances by whole refilled units, so the
+    # sub-unit remainder carries over to the next refill.
+    _token_bucket: int = field(default=0, init=False, repr=False)
+    _request_bucket: int = field(default=0, init=False, repr=False)
+    _token_clock_ns: int = field(default_factory=time.monotonic_ns, init=False, repr=False)
+    _request_clock_ns: int = field(default_factory=time.monotonic_ns, init=False, repr=False)
+    _ns_per_token: int = field(default=0, init=False, repr=False)
+    _ns_per_request: int = field(default=0, init=False, repr=False)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
 
     def __post_init__(self) -> None:
         # Start with full buckets
-        self._token_bucket = float(self.tokens_per_minute)
-        self._request_bucket = float(self.requests_per_minute)
+        self._token_bucket = self.tokens_per_minute
+        self._request_bucket = self.requests_per_minute
+        self._ns_per_token = NS_PER_MINUTE // self.tokens_per_minute
+        self._ns_per_request = NS_PER_MINUTE // self.requests_per_minute
 
     async def acquire(self, estimated_tokens: int) -> None:
         """Acquire tokens from the bucket, waiting if necessary.
@@ -76,16 +104,21 @@ class TokenBucketRateLimiter:
 
     def _refill(self) -> None:
         """Refill buckets based on time elapsed."""
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._last_refill = now
-
-        # Refill proportionally to time elapsed
-        token_refill = (elapsed / 60) * self.tokens_per_minute
-        request_refill = (elapsed / 60) * self.requests_per_minute
-
-        self._token_bucket = min(self.tokens_per_minute, self._token_bucket + token_refill)
-        self._request_bucket = min(self.requests_per_minute, self._request_bucket + request_refill)
+        now = time.monotonic_ns()
+        self._token_bucket, self._token_clock_ns = _refill_bucket(
+            self._token_bucket,
+            self._token_clock_ns,
+            now,
+            self._ns_per_token,
+            self.tokens_per_minute,
+        )
+        self._request_bucket, self._request_clock_ns = _refill_bucket(
+            self._request_bucket,
+            self._request_clock_ns,
+            now,
+            self._ns_per_request,
+            self.requests_per_minute,
+        )
 
     def _calculate_wait(self, needed: float, available: float, rate: float) -> float:
         """Calculate wait time to acquire needed amount."""
@@ -100,4 +133,4 @@ class TokenBucketRateLimiter:
     def available_tokens(self) -> int:
         """Current available tokens (for monitoring)."""
         self._refill()
-        return int(self._token_bucket)
+        return self._token_bucket
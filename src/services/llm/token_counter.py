@@ -5,13 +5,38 @@ typical Llama tokenization patterns. This is for rate limiting
 purposes - actual usage comes from API response.
 """
 
+from functools import lru_cache
 
+# UTF-8 prefixes for the Devanagari block: U+0900-U+093F encode as
+# E0 A4 xx and U+0940-U+097F as E0 A5 xx. E0 never appears as a
+# continuation byte, so counting these pairs counts Devanagari chars exactly.
+_DEVANAGARI_LOW = b"\xe0\xa4"
+_DEVANAGARI_HIGH = b"\xe0\xa5"
+
+
+def _count_devanagari(text: str) -> int:
+    """Count characters in the Devanagari block (U+0900-U+097F).
+
+    Scans the UTF-8 encoding with bytes.count rather than looping over
+    characters in Python; pure-ASCII text short-circuits to zero.
+    """
+    if text.isascii():
+        return 0
+    encoded = text.encode("utf-8", "surrogatepass")
+    return encoded.count(_DEVANAGARI_LOW) + encoded.count(_DEVANAGARI_HIGH)
+
+
+@lru_cache(maxsize=1024)
 def estimate_llama_tokens(text: str) -> int:
     """Estimate token count for Llama models.
 
     Uses a simple heuristic: ~4 characters per token for English,
     ~2 characters per token for Hindi/Devanagari script.
 
+    Results are memoized: every turn re-estimates the conversation history
+    and a system prompt that is mostly unchanged, and for Hindi text the
+    UTF-8 encode costs far more than the lookup.
+
     Args:
         text: Input text to estimate
 
@@ -22,7 +47,7 @@ def estimate_llama_tokens(text: str) -> int:
         return 0
 
     # Count Devanagari characters (Hindi script)
-    devanagari_count = sum(1 for char in text if "\u0900" <= char <= "\u097F")
+    devanagari_count = _count_devanagari(text)
 
     # Estimate based on script mix
     non_devanagari = len(text) - devanagari_count
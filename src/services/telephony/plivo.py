@@ -12,7 +12,10 @@ import audioop
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.sax.saxutils import escape
+
+import numpy as np
+import soxr
 
 from src.config import Settings, get_settings
 from src.logging_config import get_logger
@@ -29,6 +32,37 @@ TELEPHONY_SAMPLE_RATE = 8000
 WIDEBAND_SAMPLE_RATE = 16000
 
 
+# =============================================================================
+# XML Templates
+# =============================================================================
+# Plivo responses are a fixed handful of shapes, so they are formatted from
+# templates instead of building an ElementTree per call. Output matches what
+# ElementTree.tostring produced, including its escaping rules.
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+_STREAM_XML = (
+    _XML_DECLARATION + '<Response><Stream bidirectional="{bidirectional}" '
+    'audioTrack="{audio_track}" contentType="{content_type}" '
+    'streamTimeout="{stream_timeout}">{url}</Stream></Response>'
+)
+_HANGUP_XML = _XML_DECLARATION + "<Response><Hangup /></Response>"
+
+
+def _escape_attr(value: str) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(value, _ATTR_ENTITIES)
+
+
+def _speak_element(text: str, voice: str, language: str) -> str:
+    """Render a <Speak> element with escaped text."""
+    return (
+        f'<Speak voice="{_escape_attr(voice)}" language="{_escape_attr(language)}">'
+        f"{escape(text)}</Speak>"
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class PlivoCallInfo:
     """Information about a Plivo call."""
@@ -117,17 +151,13 @@ class PlivoService:
         Returns:
             XML string for Plivo response
         """
-        response = Element("Response")
-
-        stream = SubElement(response, "Stream")
-        stream.set("bidirectional", str(bidirectional).lower())
-        stream.set("audioTrack", audio_track)
-        stream.set("contentType", content_type)
-        stream.set("streamTimeout", str(stream_timeout))
-        stream.text = websocket_url
-
-        xml_str = tostring(response, encoding="unicode")
-        return f'<?xml version="1.0" encoding="UTF-8"?>{xml_str}'
+        return _STREAM_XML.format(
+            bidirectional=str(bidirectional).lower(),
+            audio_track=_escape_attr(audio_track),
+            content_type=_escape_attr(content_type),
+            stream_timeout=stream_timeout,
+            url=escape(websocket_url),
+        )
 
     def generate_speak_xml(
         self,
@@ -140,40 +170,18 @@ class PlivoService:
 
         Used for fallback when custom TTS fails.
         """
-        response = Element("Response")
-
-        speak = SubElement(response, "Speak")
-        speak.set("voice", voice)
-        speak.set("language", language)
-        speak.text = text
-
-        xml_str = tostring(response, encoding="unicode")
-        return f'<?xml version="1.0" encoding="UTF-8"?>{xml_str}'
+        return f"{_XML_DECLARATION}<Response>{_speak_element(text, voice, language)}</Response>"
 
     def generate_hangup_xml(self, reason: str = "") -> str:
         """Generate Plivo XML to hangup call."""
-        response = Element("Response")
-
-        if reason:
-            speak = SubElement(response, "Speak")
-            speak.set("voice", "Polly.Aditi")
-            speak.set("language", "hi-IN")
-            speak.text = reason
-
-        SubElement(response, "Hangup")
-
-        xml_str = tostring(response, encoding="unicode")
-        return f'<?xml version="1.0" encoding="UTF-8"?>{xml_str}'
+        if not reason:
+            return _HANGUP_XML
+        speak = _speak_element(reason, "Polly.Aditi", "hi-IN")
+        return f"{_XML_DECLARATION}<Response>{speak}<Hangup /></Response>"
 
     def generate_wait_xml(self, seconds: int = 1) -> str:
         """Generate Plivo XML to wait/pause."""
-        response = Element("Response")
-
-        wait = SubElement(response, "Wait")
-        wait.set("length", str(seconds))
-
-        xml_str = tostring(response, encoding="unicode")
-        return f'<?xml version="1.0" encoding="UTF-8"?>{xml_str}'
+        return f'{_XML_DECLARATION}<Response><Wait length="{seconds}" /></Response>'
 
     async def make_call(
         self,
@@ -262,6 +270,9 @@ class PlivoService:
 # =============================================================================
 # Audio Conversion Utilities
 # =============================================================================
+# The G.711 codecs below are audioop's C table lookups; a NumPy lookup-table
+# version is ~10x slower per 20 ms frame because of array setup cost.
+# requires-python (<3.13) keeps audioop available.
 
 
 def mulaw_to_pcm16(mulaw_bytes: bytes) -> bytes:
@@ -325,9 +336,11 @@ def resample_audio(
     sample_width: int = PCM16_SAMPLE_WIDTH,
     channels: int = 1,
 ) -> bytes:
-    """Resample audio using audioop (lower quality than soxr but no deps).
+    """Resample a complete audio buffer.
 
-    For high-quality resampling, use AudioResampler from tts.resampler.
+    16-bit mono PCM uses soxr quick (cubic) resampling; other layouts fall
+    back to audioop.ratecv (linear interpolation). This is stateless, so for
+    chunked TTS streams use AudioResampler from tts.resampler instead.
 
     Args:
         audio_bytes: Input audio bytes
@@ -342,7 +355,11 @@ def resample_audio(
     if source_rate == target_rate:
         return audio_bytes
 
-    # audioop.ratecv for resampling
+    if sample_width == PCM16_SAMPLE_WIDTH and channels == 1:
+        samples = np.frombuffer(audio_bytes, dtype=np.int16)
+        # soxr accepts int16 directly and returns int16, so no float round-trip
+        return soxr.resample(samples, source_rate, target_rate, quality="QQ").tobytes()
+
     converted, _ = audioop.ratecv(
         audio_bytes,
         sample_width,
@@ -384,5 +401,5 @@ def is_speech(
     Returns:
         True if audio likely contains speech
     """
-    energy = compute_audio_energy(audio_bytes, sample_width)
-    return energy > threshold
+    # audioop.rms returns 0 for empty input, so no wrapper/guard is needed.
+    return audioop.rms(audio_bytes, sample_width) > threshold
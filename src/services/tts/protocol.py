@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Protocol
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
 
 @dataclass(frozen=True, slots=True)
 class AudioChunk:
@@ -22,7 +25,14 @@ class AudioChunk:
     channels: int = 1
     duration_ms: float = 0.0  # Duration of this chunk
     is_final: bool = False  # True for last chunk
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Creation time as integer epoch nanoseconds: reading the clock is much
+    # cheaper than datetime.now(UTC) for the many chunks a stream yields.
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as an aware UTC datetime (microsecond precision)."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
 
 
 @dataclass
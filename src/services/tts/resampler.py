@@ -66,24 +66,15 @@ class AudioResampler:
 
     def _resample_sync(self, audio_data: bytes) -> bytes:
         """Synchronous resampling (called in thread pool)."""
-        # Convert bytes to numpy array (int16)
-        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-
-        # Normalize to float64 for soxr (range -1 to 1)
-        audio_float = audio_array.astype(np.float64) / 32768.0
-
-        # Resample using soxr
+        # soxr resamples int16 natively (converting and clipping in C), so the
+        # zero-copy view of the input goes straight in and int16 comes out.
         resampled = soxr.resample(
-            audio_float,
+            np.frombuffer(audio_data, dtype=np.int16),
             self._source_rate,
             self._target_rate,
             quality=self._quality,
         )
-
-        # Convert back to int16
-        resampled_int16 = (resampled * 32767).clip(-32768, 32767).astype(np.int16)
-
-        return bytes(resampled_int16.tobytes())
+        return resampled.tobytes()
 
     def resample_sync(self, audio_data: bytes) -> bytes:
         """Synchronous resample for use in non-async contexts."""
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import AsyncGenerator, Callable, Generator
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
+# Heavy application modules are imported here, at collection time, so
+# their import cost is not attributed to whichever test happens to run first.
+import src.core.reservation_flow  # noqa: F401
+import src.db.repositories.calls  # noqa: F401
+import src.db.repositories.reservations  # noqa: F401
+import src.observability.metrics  # noqa: F401
+import src.services.llm.extractor  # noqa: F401
 from src.config import Settings
 
+# Env-gated integration modules are skipped at collection time, not per test.
+collect_ignore: list[str] = []
+if not (os.environ.get("DEEPGRAM_API_KEY") and os.environ.get("DEEPGRAM_TEST_AUDIO")):
+    collect_ignore.append("test_services/test_deepgram_integration.py")
+
 
 def build_settings(**overrides) -> Settings:
     """Create a Settings object with safe test defaults."""
@@ -31,7 +46,7 @@ def build_settings(**overrides) -> Settings:
     return Settings(**base)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def settings_factory() -> Callable[..., Settings]:
     """Return a factory to build Settings with overrides."""
     return build_settings
@@ -48,9 +63,13 @@ def settings(settings_factory: Callable[..., Settings]) -> Settings:
 # =============================================================================
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create an in-memory async SQLite engine for testing."""
+    """Create a shared in-memory async SQLite engine for testing.
+
+    The schema is created once per session; tests are isolated by the
+    transaction rollback in ``async_session`` rather than by DDL.
+    """
     # Import models to register them with SQLModel metadata
     from src.db import models  # noqa: F401
 
@@ -58,8 +77,19 @@ async def async_engine():
         "sqlite+aiosqlite:///:memory:",
         echo=False,
         future=True,
+        poolclass=StaticPool,
     )
 
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -69,19 +99,27 @@ async def async_engine():
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create an async database session for testing."""
-    async_session_maker = sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
-
-    async with async_session_maker() as session:
-        yield session
+    """Create an async database session for testing.
+
+    The session is bound to an outer transaction that is rolled back on
+    teardown; ``commit()``/``rollback()`` inside tests only act on a
+    SAVEPOINT, so nothing leaks between tests.
+    """
+    async with async_engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
 
 
 # =============================================================================
@@ -132,16 +170,12 @@ async def _override_get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
-@pytest.fixture
-def test_client(settings_factory, monkeypatch) -> Generator:
-    """FastAPI TestClient with patched settings and in-memory database."""
-    import asyncio
+def _build_test_client(test_settings: Settings, monkeypatch: pytest.MonkeyPatch) -> Generator:
+    """Yield a TestClient with patched settings and the in-memory test DB."""
     import sys
 
     from fastapi.testclient import TestClient
 
-    test_settings = settings_factory()
-
     # Patch get_settings globally before importing anything
     # Need to patch in all modules that import it
     monkeypatch.setattr("src.config.get_settings", lambda: test_settings)
@@ -185,16 +219,33 @@ def test_client(settings_factory, monkeypatch) -> Generator:
     # Override get_session dependency
     app.dependency_overrides[get_session] = _override_get_session
 
-    with TestClient(app) as client:
-        yield client
-
-    # Cleanup: drop all tables after test
+    # Cleanup: drop all tables after use
     async def cleanup():
         engine = _get_test_engine()
         async with engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.drop_all)
 
-    asyncio.get_event_loop().run_until_complete(cleanup())
+    with TestClient(app) as client:
+        yield client
+        # Run on the app's own loop, where the test engine was used
+        client.portal.call(cleanup)
+
+
+@pytest.fixture
+def test_client(settings_factory, monkeypatch) -> Generator:
+    """FastAPI TestClient with patched settings and in-memory database."""
+    yield from _build_test_client(settings_factory(), monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def shared_test_client() -> Generator:
+    """Module-scoped TestClient for read-only endpoint tests.
+
+    Skips per-test app startup/shutdown. Only use it from tests that do
+    not mutate app or database state.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        yield from _build_test_client(build_settings(), monkeypatch)
 
 
 @pytest.fixture
@@ -8,6 +8,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.api.auth import TokenPayload
 from src.db.models import (
     Business,
     CallLog,
@@ -21,6 +22,15 @@ from src.db.models import (
 # Fixtures
 # =============================================================================
 
+# Shared admin token; TokenPayload is frozen so reuse across tests is safe.
+_ADMIN_TOKEN = TokenPayload(
+    sub="user-456",
+    email="admin@example.com",
+    preferred_username="admin",
+    realm_access={"roles": ["admin"]},
+    business_ids=["test_business"],
+)
+
 
 @pytest.fixture
 def mock_jwt_token():
@@ -121,8 +131,6 @@ class TestReviewsAPI:
 
     def test_list_reviews_requires_business_id_header(self, test_client, mock_jwt_token):
         """List reviews requires X-Business-ID header."""
-        from src.api.auth import TokenPayload
-
         with patch("src.api.auth.decode_token") as mock_decode:
             mock_decode.return_value = TokenPayload(**mock_jwt_token)
             response = test_client.get(
@@ -157,16 +165,8 @@ class TestSuggestionStatusUpdate:
         self, test_client, mock_jwt_token, auth_headers
     ):
         """Updating non-existent suggestion returns 404."""
-        from src.api.auth import TokenPayload
-
         with patch("src.api.auth.decode_token") as mock_decode:
-            mock_decode.return_value = TokenPayload(
-                sub="user-456",
-                email="admin@example.com",
-                preferred_username="admin",
-                realm_access={"roles": ["admin"]},
-                business_ids=["test_business"],
-            )
+            mock_decode.return_value = _ADMIN_TOKEN
             response = test_client.patch(
                 "/api/reviews/suggestions/nonexistent-id",
                 headers=auth_headers,
@@ -183,7 +183,6 @@ class TestSuggestionStatusUpdate:
 class TestDuplicateReviewPrevention:
     """Tests for unique constraint on call_log_id."""
 
-    @pytest.mark.asyncio
     async def test_unique_constraint_on_call_log_id(
         self,
         async_session,
@@ -3,6 +3,40 @@
 from __future__ import annotations
 
 import base64
+import time
+
+import pytest
+from fastapi import HTTPException, status
+from starlette.websockets import WebSocketDisconnect
+
+from src.api.auth import TokenPayload
+from src.api.websocket import audio_stream
+
+_WS_TOKEN = "test-token"
+
+
+def _ws_url(call_id: str) -> str:
+    """Audio stream URL carrying the test token."""
+    return f"/ws/audio/{call_id}?token={_WS_TOKEN}"
+
+
+@pytest.fixture(autouse=True)
+def decode_calls(monkeypatch) -> list[str]:
+    """Accept any token except "bad", recording each real validation.
+
+    The auth cache is reset per test so hits and misses are predictable.
+    """
+    calls: list[str] = []
+
+    def fake_decode(token: str) -> TokenPayload:
+        calls.append(token)
+        if token == "bad":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        return TokenPayload(sub="plivo", exp=int(time.time()) + 3600)
+
+    monkeypatch.setattr(audio_stream, "decode_token", fake_decode)
+    monkeypatch.setattr(audio_stream, "_ws_auth_cache", {})
+    return calls
 
 
 class TestWebSocketConnection:
@@ -10,13 +44,13 @@ class TestWebSocketConnection:
 
     def test_websocket_connects(self, test_client) -> None:
         """Test WebSocket connection is accepted."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-001") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-001")) as websocket:
             # Connection should be accepted
             assert websocket is not None
 
     def test_websocket_start_event(self, test_client) -> None:
         """Test handling of start event."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-002") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-002")) as websocket:
             # Send start event
             start_message = {
                 "event": "start",
@@ -36,7 +70,7 @@ class TestWebSocketConnection:
 
     def test_websocket_stop_event(self, test_client) -> None:
         """Test handling of stop event closes connection."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-003") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-003")) as websocket:
             # Send start event
             start_message = {
                 "event": "start",
@@ -57,7 +91,7 @@ class TestWebSocketMedia:
 
     def test_websocket_media_event(self, test_client) -> None:
         """Test handling of media event with audio data."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-004") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-004")) as websocket:
             # Send start event first
             start_message = {
                 "event": "start",
@@ -83,7 +117,7 @@ class TestWebSocketMedia:
 
     def test_websocket_invalid_json(self, test_client) -> None:
         """Test handling of invalid JSON."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-005") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-005")) as websocket:
             # Send invalid JSON - should be handled gracefully
             websocket.send_text("not valid json {{{")
 
@@ -93,7 +127,7 @@ class TestWebSocketDTMF:
 
     def test_websocket_dtmf_event(self, test_client) -> None:
         """Test handling of DTMF event."""
-        with test_client.websocket_connect("/ws/audio/test-call-ws-006") as websocket:
+        with test_client.websocket_connect(_ws_url("test-call-ws-006")) as websocket:
             # Send start event first
             start_message = {
                 "event": "start",
@@ -114,3 +148,77 @@ class TestWebSocketDTMF:
             websocket.send_json(dtmf_message)
 
             # Should handle without error
+
+
+class TestWebSocketAuth:
+    """Tests for token checks on the audio WebSocket endpoint."""
+
+    def test_missing_token_rejected(self, test_client, decode_calls) -> None:
+        """Test a connection without a token is closed with 1008."""
+        with (
+            pytest.raises(WebSocketDisconnect) as exc_info,
+            test_client.websocket_connect("/ws/audio/test-call-ws-007"),
+        ):
+            pass
+
+        assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+        assert decode_calls == []
+
+    def test_invalid_token_rejected(self, test_client) -> None:
+        """Test a connection with an invalid token is closed with 1008."""
+        with (
+            pytest.raises(WebSocketDisconnect) as exc_info,
+            test_client.websocket_connect("/ws/audio/test-call-ws-008?token=bad"),
+        ):
+            pass
+
+        assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+    def test_reconnect_uses_cached_auth(self, test_client, decode_calls) -> None:
+        """Test reconnecting with the same token skips re-validation."""
+        url = _ws_url("test-call-ws-009")
+        with test_client.websocket_connect(url) as websocket:
+            assert websocket is not None
+        with test_client.websocket_connect(url) as websocket:
+            assert websocket is not None
+
+        assert decode_calls == [_WS_TOKEN]
+
+
+class TestWebSocketAuthCache:
+    """Tests for the per-connection JWT payload cache."""
+
+    def test_reconnect_skips_revalidation(self, decode_calls) -> None:
+        """Test a second connect with the same token reuses the payload."""
+        payload = audio_stream.authenticate_websocket("tok", "call-1")
+        assert audio_stream.authenticate_websocket("tok", "call-1") is payload
+        assert decode_calls == ["tok"]
+
+        # Different call_id is a separate cache entry
+        audio_stream.authenticate_websocket("tok", "call-2")
+        assert decode_calls == ["tok", "tok"]
+
+    def test_entry_expires_with_token(self, monkeypatch, decode_calls) -> None:
+        """Test cached payloads are not served past the token's exp."""
+
+        def expired_decode(token: str) -> TokenPayload:
+            decode_calls.append(token)
+            return TokenPayload(sub="plivo", exp=int(time.time()) - 1)
+
+        monkeypatch.setattr(audio_stream, "decode_token", expired_decode)
+
+        audio_stream.authenticate_websocket("tok", "call-1")
+        audio_stream.authenticate_websocket("tok", "call-1")
+        assert len(decode_calls) == 2
+
+    def test_full_cache_evicts_oldest(self, monkeypatch) -> None:
+        """Test inserting into a full cache drops the oldest entry."""
+        monkeypatch.setattr(audio_stream, "WS_AUTH_CACHE_MAX_ENTRIES", 2)
+
+        audio_stream.authenticate_websocket("tok", "call-1")
+        audio_stream.authenticate_websocket("tok", "call-2")
+        oldest = next(iter(audio_stream._ws_auth_cache))
+        audio_stream.authenticate_websocket("tok", "call-3")
+
+        assert len(audio_stream._ws_auth_cache) == 2
+        assert oldest not in audio_stream._ws_auth_cache
@@ -104,7 +104,6 @@ class TestAudioBuffer:
 
         assert chunk == b"\x00\x01\x02"
 
-    @pytest.mark.asyncio
     async def test_get_timeout(self) -> None:
         """Test get returns None on timeout."""
         buffer = AudioBuffer()
@@ -131,7 +130,6 @@ class TestAudioBuffer:
         # After close, appending should be ignored
         buffer.append(b"\x00")
 
-    @pytest.mark.asyncio
     async def test_drain(self) -> None:
         """Test draining buffer."""
         buffer = AudioBuffer()
@@ -203,7 +201,6 @@ class TestVoicePipeline:
         assert isinstance(metrics, PipelineMetrics)
         assert metrics.total_turns == 0
 
-    @pytest.mark.asyncio
     async def test_configure(self, pipeline: VoicePipeline) -> None:
         """Test pipeline configuration."""
         await pipeline.configure(
@@ -280,7 +277,6 @@ class TestVoicePipeline:
 
         assert key_a != key_b
 
-    @pytest.mark.asyncio
     async def test_finalize(self, pipeline: VoicePipeline) -> None:
         """Test pipeline finalization."""
         metrics = await pipeline.finalize()
@@ -1,29 +1,107 @@
 """Tests for reservation flow orchestrator."""
 
+import inspect
+from collections import deque
+from collections.abc import Generator
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 from src.core.conversation_state import ConversationPhase, ConversationState
 from src.core.reservation_flow import BookingResult, ReservationFlow
 from src.db.models import ReservationStatus
-from src.db.repositories.reservations import AvailabilityResult
+from src.db.repositories.reservations import AsyncReservationRepository, AvailabilityResult
 from src.services.llm.extractor import ExtractedReservation, ExtractionIntent
 
 
-@pytest.fixture
-def mock_repo() -> AsyncMock:
-    """Create a mock async reservation repository."""
-    repo = AsyncMock()
-    repo.session = MagicMock()
-    repo.session.add = MagicMock()
-    return repo
+def _make_extraction(**fields: Any) -> ExtractedReservation:
+    """Build an extraction, defaulting to the MAKE_RESERVATION intent."""
+    fields.setdefault("intent", ExtractionIntent.MAKE_RESERVATION)
+    return ExtractedReservation(**fields)
 
 
-@pytest.fixture
-def flow(mock_repo: AsyncMock) -> ReservationFlow:
-    """Create a ReservationFlow instance with mocked repo."""
+# Fully specified booking request; ReservationFlow never mutates extractions
+# (merges build new instances), so tests can share one.
+_COMPLETE_EXTRACTION = _make_extraction(
+    party_size=4,
+    reservation_date=date(2025, 2, 15),
+    reservation_time="19:00",
+    customer_name="Sharma",
+)
+
+
+class FakeReservationRepo:
+    """Minimal async stand-in for AsyncReservationRepository.
+
+    Covers only what ReservationFlow touches (check_availability and
+    session.add); far cheaper than an AsyncMock's child-mock tree.
+    Like a specced mock, it has a closed attribute set (__slots__) and
+    mirrors the real check_availability signature.
+    """
+
+    __slots__ = (
+        "session",
+        "added",
+        "availability",
+        "availability_sequence",
+        "availability_calls",
+    )
+
+    def __init__(self) -> None:
+        self.added: list[Any] = []
+        self.session = SimpleNamespace(add=self.added.append)
+        self.availability: AvailabilityResult | None = None
+        self.availability_sequence: deque[AvailabilityResult] = deque()
+        self.availability_calls: list[dict[str, Any]] = []
+
+    async def check_availability(
+        self,
+        business_id: str,
+        reservation_date: date,
+        reservation_time: str,
+        party_size: int,
+    ) -> AvailabilityResult:
+        self.availability_calls.append({
+            "business_id": business_id,
+            "reservation_date": reservation_date,
+            "reservation_time": reservation_time,
+            "party_size": party_size,
+        })
+        if self.availability_sequence:
+            return self.availability_sequence.popleft()
+        assert self.availability is not None, "availability not configured"
+        return self.availability
+
+    def reset(self) -> None:
+        """Forget configured results and recorded calls."""
+        self.added.clear()
+        self.availability = None
+        self.availability_sequence.clear()
+        self.availability_calls = []
+
+
+def test_fake_repo_matches_repository_signature() -> None:
+    """FakeReservationRepo.check_availability tracks the real signature."""
+    fake = inspect.signature(FakeReservationRepo.check_availability)
+    real = inspect.signature(AsyncReservationRepository.check_availability)
+    assert list(fake.parameters) == list(real.parameters)
+
+
+@pytest.fixture(scope="module")
+def mock_repo() -> FakeReservationRepo:
+    """Create a fake async reservation repository (shared, reset per test)."""
+    return FakeReservationRepo()
+
+
+@pytest.fixture(scope="module")
+def flow(mock_repo: FakeReservationRepo) -> ReservationFlow:
+    """Create a ReservationFlow instance with mocked repo.
+
+    ReservationFlow holds no per-booking state, so one instance serves
+    the whole module.
+    """
     return ReservationFlow(
         repo=mock_repo,
         business_id="test_business",
@@ -32,45 +110,44 @@ def flow(mock_repo: AsyncMock) -> ReservationFlow:
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_repo(mock_repo: FakeReservationRepo) -> Generator[None, None, None]:
+    """Clear configured results and recorded calls between tests."""
+    yield
+    mock_repo.reset()
+
+
 class TestReservationFlow:
     """Tests for ReservationFlow class."""
 
-    @pytest.mark.asyncio
     async def test_process_extraction_operator_request(
         self, flow: ReservationFlow
     ) -> None:
         """Operator request transitions to TRANSFERRED."""
         state = ConversationState()
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.OPERATOR_REQUEST,
-        )
+        extraction = _make_extraction(intent=ExtractionIntent.OPERATOR_REQUEST)
 
         response, new_state = await flow.process_extraction(extraction, state)
 
         assert response is None  # Let LLM handle
         assert new_state.phase == ConversationPhase.TRANSFERRED
 
-    @pytest.mark.asyncio
     async def test_process_extraction_chitchat(self, flow: ReservationFlow) -> None:
         """Non-reservation intents pass through."""
         state = ConversationState()
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.CHITCHAT,
-        )
+        extraction = _make_extraction(intent=ExtractionIntent.CHITCHAT)
 
         response, new_state = await flow.process_extraction(extraction, state)
 
         assert response is None
         assert new_state.phase == ConversationPhase.GREETING
 
-    @pytest.mark.asyncio
     async def test_process_extraction_partial_info(
         self, flow: ReservationFlow
     ) -> None:
         """Partial reservation info triggers follow-up question."""
         state = ConversationState()
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        extraction = _make_extraction(
             party_size=4,
         )
 
@@ -83,19 +160,12 @@ class TestReservationFlow:
         assert response is not None
         assert "din" in response.lower() or "date" in response.lower()
 
-    @pytest.mark.asyncio
     async def test_process_extraction_complete_info(
         self, flow: ReservationFlow
     ) -> None:
         """Complete reservation info triggers confirmation."""
         state = ConversationState()
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+        extraction = _COMPLETE_EXTRACTION
 
         response, new_state = await flow.process_extraction(extraction, state)
 
@@ -103,7 +173,6 @@ class TestReservationFlow:
         assert response is not None
         assert "confirm" in response.lower() or "sahi" in response.lower()
 
-    @pytest.mark.asyncio
     async def test_process_extraction_accumulates_info(
         self, flow: ReservationFlow
     ) -> None:
@@ -111,15 +180,13 @@ class TestReservationFlow:
         state = ConversationState()
 
         # First extraction - party size
-        first = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        first = _make_extraction(
             party_size=4,
         )
         _, state = await flow.process_extraction(first, state)
 
         # Second extraction - date
-        second = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        second = _make_extraction(
             reservation_date=date(2025, 2, 15),
         )
         _, state = await flow.process_extraction(second, state)
@@ -133,20 +200,13 @@ class TestReservationFlow:
 class TestHandleConfirmation:
     """Tests for confirmation handling."""
 
-    @pytest.mark.asyncio
     async def test_handle_confirmation_rejected(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """User rejecting confirmation goes back to gathering."""
         state = ConversationState()
         state.phase = ConversationPhase.AWAITING_CONFIRMATION
-        state.pending_reservation = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+        state.pending_reservation = _COMPLETE_EXTRACTION
 
         response, new_state = await flow.handle_confirmation(
             confirmed=False, state=state
@@ -154,24 +214,17 @@ class TestHandleConfirmation:
 
         assert new_state.phase == ConversationPhase.GATHERING_INFO
         assert "change" in response.lower()
-        mock_repo.check_availability.assert_not_called()
+        assert mock_repo.availability_calls == []
 
-    @pytest.mark.asyncio
     async def test_handle_confirmation_success(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Successful confirmation creates reservation."""
         state = ConversationState()
         state.phase = ConversationPhase.AWAITING_CONFIRMATION
-        state.pending_reservation = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+        state.pending_reservation = _COMPLETE_EXTRACTION
 
-        mock_repo.check_availability.return_value = AvailabilityResult(
+        mock_repo.availability = AvailabilityResult(
             available=True,
             used_seats=10,
             total_seats=40,
@@ -186,24 +239,17 @@ class TestHandleConfirmation:
 
         assert new_state.phase == ConversationPhase.COMPLETED
         assert "confirm" in response.lower() or "booking" in response.lower()
-        mock_repo.session.add.assert_called_once()
+        assert len(mock_repo.added) == 1
 
-    @pytest.mark.asyncio
     async def test_handle_confirmation_unavailable(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Unavailable slot offers alternatives."""
         state = ConversationState()
         state.phase = ConversationPhase.AWAITING_CONFIRMATION
-        state.pending_reservation = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+        state.pending_reservation = _COMPLETE_EXTRACTION
 
-        mock_repo.check_availability.return_value = AvailabilityResult(
+        mock_repo.availability = AvailabilityResult(
             available=False,
             reason="capacity_full",
             used_seats=38,
@@ -222,13 +268,11 @@ class TestHandleConfirmation:
 class TestCheckAndBook:
     """Tests for check_and_book method."""
 
-    @pytest.mark.asyncio
     async def test_check_and_book_incomplete(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Incomplete reservation fails."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        extraction = _make_extraction(
             party_size=4,
             # Missing date, time, name
         )
@@ -237,91 +281,51 @@ class TestCheckAndBook:
 
         assert result.success is False
         assert "incomplete" in result.message.lower()
-        mock_repo.check_availability.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_check_and_book_party_too_large(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
-    ) -> None:
-        """Party too large returns appropriate message."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=15,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
-
-        mock_repo.check_availability.return_value = AvailabilityResult(
-            available=False,
-            reason="party_size_too_large",
-        )
-
-        result = await flow.check_and_book(extraction)
-
-        assert result.success is False
-        assert "whatsapp" in result.message.lower()
-
-    @pytest.mark.asyncio
-    async def test_check_and_book_too_soon(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
-    ) -> None:
-        """Booking too close to now returns appropriate message."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
-
-        mock_repo.check_availability.return_value = AvailabilityResult(
-            available=False,
-            reason="too_soon",
-        )
-
-        result = await flow.check_and_book(extraction)
-
-        assert result.success is False
-        assert "minute" in result.message.lower()
-
-    @pytest.mark.asyncio
-    async def test_check_and_book_closed_day(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        assert mock_repo.availability_calls == []
+
+    @pytest.mark.parametrize(
+        ("reason", "party_size", "reservation_date", "needle"),
+        [
+            ("party_size_too_large", 15, date(2025, 2, 15), "whatsapp"),
+            ("too_soon", 4, date(2025, 2, 15), "minute"),
+            ("closed", 4, date(2025, 2, 17), "band"),  # Monday
+            ("outside_hours", 4, date(2025, 2, 15), "open nahi"),
+        ],
+    )
+    async def test_check_and_book_unavailable_reason(
+        self,
+        flow: ReservationFlow,
+        mock_repo: FakeReservationRepo,
+        reason: str,
+        party_size: int,
+        reservation_date: date,
+        needle: str,
     ) -> None:
-        """Booking on closed day returns appropriate message."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 17),  # Monday
+        """Each unavailability reason maps to its own message."""
+        extraction = _make_extraction(
+            party_size=party_size,
+            reservation_date=reservation_date,
             reservation_time="19:00",
             customer_name="Sharma",
         )
 
-        mock_repo.check_availability.return_value = AvailabilityResult(
+        mock_repo.availability = AvailabilityResult(
             available=False,
-            reason="closed",
+            reason=reason,
         )
 
         result = await flow.check_and_book(extraction)
 
         assert result.success is False
-        assert "band" in result.message.lower()
+        assert needle in result.message.lower()
 
-    @pytest.mark.asyncio
     async def test_check_and_book_success(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Successful booking creates reservation and returns message."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date(2025, 2, 15),
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+        extraction = _COMPLETE_EXTRACTION
 
-        mock_repo.check_availability.return_value = AvailabilityResult(
+        mock_repo.availability = AvailabilityResult(
             available=True,
             used_seats=10,
             total_seats=40,
@@ -339,8 +343,8 @@ class TestCheckAndBook:
         assert "4 logon" in result.message
 
         # Verify reservation was added to session
-        mock_repo.session.add.assert_called_once()
-        added_reservation = mock_repo.session.add.call_args[0][0]
+        assert len(mock_repo.added) == 1
+        added_reservation = mock_repo.added[0]
         assert added_reservation.party_size == 4
         assert added_reservation.customer_name == "Sharma"
         assert added_reservation.status == ReservationStatus.confirmed
@@ -349,24 +353,27 @@ class TestCheckAndBook:
 class TestGenerateAlternatives:
     """Tests for alternative time generation."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def _narrow_offsets(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Probe three candidate times instead of the full window."""
+        monkeypatch.setattr(ReservationFlow, "_ALTERNATIVE_OFFSETS_MINUTES", (-30, 30, 60))
+
     async def test_generate_alternatives_finds_slots(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Generates alternative times when some are available."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        extraction = _make_extraction(
             party_size=4,
             reservation_date=date(2025, 2, 15),
             reservation_time="19:00",
         )
 
         # First few calls unavailable, then available
-        mock_repo.check_availability.side_effect = [
+        mock_repo.availability_sequence.extend([
             AvailabilityResult(available=False, reason="capacity_full"),
             AvailabilityResult(available=True, used_seats=10, total_seats=40),
             AvailabilityResult(available=True, used_seats=15, total_seats=40),
-        ]
+        ])
 
         alternatives = await flow.generate_alternatives(extraction)
 
@@ -374,19 +381,17 @@ class TestGenerateAlternatives:
         assert all("time" in alt for alt in alternatives)
         assert all("date" in alt for alt in alternatives)
 
-    @pytest.mark.asyncio
     async def test_generate_alternatives_none_available(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Returns empty list when no alternatives available."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        extraction = _make_extraction(
             party_size=4,
             reservation_date=date(2025, 2, 15),
             reservation_time="19:00",
         )
 
-        mock_repo.check_availability.return_value = AvailabilityResult(
+        mock_repo.availability = AvailabilityResult(
             available=False,
             reason="capacity_full",
         )
@@ -394,47 +399,41 @@ class TestGenerateAlternatives:
         alternatives = await flow.generate_alternatives(extraction)
 
         assert alternatives == []
+        assert len(mock_repo.availability_calls) == 3  # one probe per offset
 
-    @pytest.mark.asyncio
     async def test_generate_alternatives_missing_data(
-        self, flow: ReservationFlow, mock_repo: AsyncMock
+        self, flow: ReservationFlow, mock_repo: FakeReservationRepo
     ) -> None:
         """Returns empty list when extraction missing date/time."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
+        extraction = _make_extraction(
             party_size=4,
         )
 
         alternatives = await flow.generate_alternatives(extraction)
 
         assert alternatives == []
-        mock_repo.check_availability.assert_not_called()
+        assert mock_repo.availability_calls == []
 
 
 class TestFormatHelpers:
     """Tests for date/time formatting."""
 
-    def test_format_time_evening(self, flow: ReservationFlow) -> None:
-        """Formats evening time correctly."""
-        assert "shaam" in flow._format_time("19:00")
-        assert "7" in flow._format_time("19:00")
-
-    def test_format_time_afternoon(self, flow: ReservationFlow) -> None:
-        """Formats afternoon time correctly."""
-        result = flow._format_time("14:00")
-        assert "dopahar" in result
-        assert "2" in result
-
-    def test_format_time_morning(self, flow: ReservationFlow) -> None:
-        """Formats morning time correctly."""
-        result = flow._format_time("10:00")
-        assert "subah" in result
-        assert "10" in result
-
-    def test_format_time_half_hour(self, flow: ReservationFlow) -> None:
-        """Formats half-hour times correctly."""
-        result = flow._format_time("19:30")
-        assert "aadha" in result
+    @pytest.mark.parametrize(
+        ("time_str", "needles"),
+        [
+            pytest.param("19:00", ("shaam", "7"), id="evening"),
+            pytest.param("14:00", ("dopahar", "2"), id="afternoon"),
+            pytest.param("10:00", ("subah", "10"), id="morning"),
+            pytest.param("19:30", ("aadha",), id="half_hour"),
+        ],
+    )
+    def test_format_time(
+        self, flow: ReservationFlow, time_str: str, needles: tuple[str, ...]
+    ) -> None:
+        """Formats times as spoken Hinglish."""
+        result = flow._format_time(time_str)
+        for needle in needles:
+            assert needle in result
 
     def test_format_time_invalid(self, flow: ReservationFlow) -> None:
         """Returns original for invalid time."""
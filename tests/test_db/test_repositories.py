@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import pytest
 
-from src.db.models import CallOutcome, DetectedLanguage, FollowupStatus
+from src.db.models import CallOutcome, ConsentType, DetectedLanguage, FollowupStatus
 from src.db.repositories.calls import (
     AsyncCallLogRepository,
     parse_consent,
@@ -16,7 +18,6 @@ from src.db.repositories.calls import (
 class TestAsyncCallLogRepository:
     """Tests for AsyncCallLogRepository."""
 
-    @pytest.mark.asyncio
     async def test_upsert_creates_new(self, async_session) -> None:
         """Test upsert creates new call log when none exists."""
         repo = AsyncCallLogRepository(async_session)
@@ -31,7 +32,6 @@ class TestAsyncCallLogRepository:
         assert call_log.business_id == "himalayan_kitchen"
         assert call_log.duration_seconds == 120
 
-    @pytest.mark.asyncio
     async def test_upsert_updates_existing(self, async_session) -> None:
         """Test upsert updates existing call log."""
         repo = AsyncCallLogRepository(async_session)
@@ -55,9 +55,8 @@ class TestAsyncCallLogRepository:
         assert call_log.duration_seconds == 180
         assert call_log.transcript == "Hello, I want to make a reservation"
 
-    @pytest.mark.asyncio
-    async def test_get_by_id(self, async_session) -> None:
-        """Test getting call log by ID."""
+    async def test_get_by_id_found_and_missing(self, async_session) -> None:
+        """Test getting call log by ID, and None for an unknown ID."""
         repo = AsyncCallLogRepository(async_session)
 
         # Create
@@ -72,21 +71,12 @@ class TestAsyncCallLogRepository:
 
         assert call_log is not None
         assert call_log.id == "test-call-003"
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self, async_session) -> None:
-        """Test getting non-existent call log returns None."""
-        repo = AsyncCallLogRepository(async_session)
-
-        call_log = await repo.get_by_id("nonexistent-call")
-
-        assert call_log is None
+        assert await repo.get_by_id("nonexistent-call") is None
 
 
 class TestCallerPreferences:
     """Tests for caller preferences management."""
 
-    @pytest.mark.asyncio
     async def test_record_preferences_creates_new(self, async_session) -> None:
         """Test recording preferences creates new entry."""
         repo = AsyncCallLogRepository(async_session)
@@ -101,7 +91,6 @@ class TestCallerPreferences:
         assert prefs.transcript_opt_out is True
         assert prefs.whatsapp_opt_out is False
 
-    @pytest.mark.asyncio
     async def test_record_preferences_updates_existing(self, async_session) -> None:
         """Test recording preferences updates existing entry."""
         repo = AsyncCallLogRepository(async_session)
@@ -120,7 +109,6 @@ class TestCallerPreferences:
 class TestWhatsappFollowup:
     """Tests for WhatsApp followup management."""
 
-    @pytest.mark.asyncio
     async def test_create_followup(self, async_session) -> None:
         """Test creating a followup entry."""
         repo = AsyncCallLogRepository(async_session)
@@ -143,7 +131,6 @@ class TestWhatsappFollowup:
 class TestAuditLog:
     """Tests for audit logging."""
 
-    @pytest.mark.asyncio
     async def test_record_audit(self, async_session) -> None:
         """Test recording an audit log entry."""
         repo = AsyncCallLogRepository(async_session)
@@ -163,38 +150,27 @@ class TestAuditLog:
 class TestParseHelpers:
     """Tests for enum parsing helpers."""
 
-    def test_parse_outcome_valid(self) -> None:
-        """Test parsing valid outcome."""
-        assert parse_outcome("resolved") == CallOutcome.resolved
-        assert parse_outcome("fallback") == CallOutcome.fallback
-        assert parse_outcome("error") == CallOutcome.error
-
-    def test_parse_outcome_invalid(self) -> None:
-        """Test parsing invalid outcome returns None."""
-        assert parse_outcome("invalid") is None
-        assert parse_outcome(None) is None
-        assert parse_outcome("") is None
-
-    def test_parse_language_valid(self) -> None:
-        """Test parsing valid language."""
-        assert parse_language("hindi") == DetectedLanguage.hindi
-        assert parse_language("english") == DetectedLanguage.english
-        assert parse_language("hinglish") == DetectedLanguage.hinglish
-
-    def test_parse_language_invalid(self) -> None:
-        """Test parsing invalid language returns None."""
-        assert parse_language("spanish") is None
-        assert parse_language(None) is None
-
-    def test_parse_consent_valid(self) -> None:
-        """Test parsing valid consent type."""
-        from src.db.models import ConsentType
-
-        assert parse_consent("none") == ConsentType.none
-        assert parse_consent("transcript") == ConsentType.transcript
-        assert parse_consent("whatsapp") == ConsentType.whatsapp
-
-    def test_parse_consent_invalid(self) -> None:
-        """Test parsing invalid consent returns None."""
-        assert parse_consent("invalid") is None
-        assert parse_consent(None) is None
+    @pytest.mark.parametrize(
+        ("parse", "value", "expected"),
+        [
+            (parse_outcome, "resolved", CallOutcome.resolved),
+            (parse_outcome, "fallback", CallOutcome.fallback),
+            (parse_outcome, "error", CallOutcome.error),
+            (parse_outcome, "invalid", None),
+            (parse_outcome, "", None),
+            (parse_outcome, None, None),
+            (parse_language, "hindi", DetectedLanguage.hindi),
+            (parse_language, "english", DetectedLanguage.english),
+            (parse_language, "hinglish", DetectedLanguage.hinglish),
+            (parse_language, "spanish", None),
+            (parse_language, None, None),
+            (parse_consent, "none", ConsentType.none),
+            (parse_consent, "transcript", ConsentType.transcript),
+            (parse_consent, "whatsapp", ConsentType.whatsapp),
+            (parse_consent, "invalid", None),
+            (parse_consent, None, None),
+        ],
+    )
+    def test_parse(self, parse: Callable, value: str | None, expected: object) -> None:
+        """Test parsing valid values and falling back to None."""
+        assert parse(value) == expected
@@ -2,14 +2,74 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
+
+import pytest
+from prometheus_client import CollectorRegistry, Gauge
+
 from src.observability.metrics import (
     ACTIVE_CALLS,
+    BARGE_IN_TOTAL,
+    CALL_DURATION,
+    CALL_TOTAL,
+    LLM_FIRST_TOKEN,
+    STT_LATENCY,
+    TTS_FIRST_CHUNK,
     get_content_type,
     get_metrics,
     record_call_metrics,
 )
 
 
+@pytest.fixture(scope="module")
+def call_metrics_registry() -> CollectorRegistry:
+    """Registry exposing only the collectors record_call_metrics writes to.
+
+    Snapshots of it skip the process/platform/GC collectors and every
+    other series accumulated in the global registry by earlier tests.
+    """
+    registry = CollectorRegistry()
+    for collector in (
+        CALL_TOTAL,
+        CALL_DURATION,
+        STT_LATENCY,
+        LLM_FIRST_TOKEN,
+        TTS_FIRST_CHUNK,
+        BARGE_IN_TOTAL,
+    ):
+        registry.register(collector)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def recorded_metrics(call_metrics_registry: CollectorRegistry) -> bytes:
+    """Record one call of each shape, then snapshot the registry once.
+
+    generate_latest walks every collector, so a single snapshot is
+    shared by all record_call_metrics assertions.
+    """
+    record_call_metrics(
+        outcome="resolved",
+        business_id="test_business",
+        duration_seconds=120.0,
+    )
+    record_call_metrics(
+        outcome="resolved",
+        business_id="test_business",
+        duration_seconds=90.0,
+        stt_latency_ms=250.0,
+        llm_latency_ms=500.0,
+        tts_latency_ms=100.0,
+    )
+    record_call_metrics(
+        outcome="resolved",
+        business_id="test_business",
+        duration_seconds=60.0,
+        barge_in_count=2,
+    )
+    return get_metrics(call_metrics_registry)
+
+
 class TestMetricsModule:
     """Tests for metrics module functions."""
 
@@ -23,98 +83,80 @@ class TestMetricsModule:
         content_type = get_content_type()
         assert "text/plain" in content_type or "text/openmetrics" in content_type
 
-    def test_record_call_metrics_basic(self) -> None:
-        """Test recording basic call metrics."""
-        # Record a call
-        record_call_metrics(
-            outcome="resolved",
-            business_id="test_business",
-            duration_seconds=120.0,
-        )
-
-        # Metrics should be recorded (check by generating output)
-        output = get_metrics().decode("utf-8")
-        assert "vartalaap_call_total" in output
-        assert "vartalaap_call_duration_seconds" in output
-
-    def test_record_call_metrics_with_latencies(self) -> None:
-        """Test recording call metrics with latencies."""
-        record_call_metrics(
-            outcome="resolved",
-            business_id="test_business",
-            duration_seconds=90.0,
-            stt_latency_ms=250.0,
-            llm_latency_ms=500.0,
-            tts_latency_ms=100.0,
-        )
-
-        output = get_metrics().decode("utf-8")
-        assert "vartalaap_stt_latency_seconds" in output
-        assert "vartalaap_llm_first_token_seconds" in output
-        assert "vartalaap_tts_first_chunk_seconds" in output
-
-    def test_record_call_metrics_with_barge_in(self) -> None:
-        """Test recording call metrics with barge-in count."""
-        record_call_metrics(
-            outcome="resolved",
-            business_id="test_business",
-            duration_seconds=60.0,
-            barge_in_count=2,
-        )
-
-        output = get_metrics().decode("utf-8")
-        assert "vartalaap_barge_in_total" in output
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            b'vartalaap_call_total{business_id="test_business",outcome="resolved"}',
+            b"vartalaap_call_duration_seconds_count",
+            b"vartalaap_stt_latency_seconds_count",
+            b"vartalaap_llm_first_token_seconds_count",
+            b"vartalaap_tts_first_chunk_seconds_count",
+            b'vartalaap_barge_in_total{business_id="test_business"}',
+        ],
+    )
+    def test_record_call_metrics(self, recorded_metrics: bytes, expected: bytes) -> None:
+        """Test recorded call metrics appear in the exposition output."""
+        assert expected in recorded_metrics
 
 
 class TestMetricsEndpoint:
-    """Tests for /metrics endpoint."""
+    """Tests for /metrics endpoint (read-only, so they share one client)."""
 
-    def test_metrics_endpoint_returns_200(self, test_client) -> None:
+    def test_metrics_endpoint_returns_200(self, shared_test_client) -> None:
         """Test /metrics endpoint returns 200."""
-        response = test_client.get("/metrics")
+        response = shared_test_client.get("/metrics")
 
         assert response.status_code == 200
 
-    def test_metrics_endpoint_content_type(self, test_client) -> None:
+    def test_metrics_endpoint_content_type(self, shared_test_client) -> None:
         """Test /metrics endpoint returns correct content type."""
-        response = test_client.get("/metrics")
+        response = shared_test_client.get("/metrics")
 
         content_type = response.headers["content-type"]
         # Prometheus content type
         assert "text/plain" in content_type or "text/openmetrics" in content_type
 
-    def test_metrics_endpoint_contains_metrics(self, test_client) -> None:
+    def test_metrics_endpoint_contains_metrics(self, shared_test_client) -> None:
         """Test /metrics endpoint contains expected metrics."""
-        response = test_client.get("/metrics")
+        response = shared_test_client.get("/metrics")
 
-        content = response.text
+        content = response.content
         # Should contain our custom metrics (even if no values yet)
-        assert "vartalaap" in content.lower() or "python" in content.lower()
+        assert b"vartalaap" in content or b"python" in content
+
+
+def _active_calls_value(business_id: str) -> float | None:
+    """Read the ACTIVE_CALLS sample for one label via the public collect() API."""
+    for metric in ACTIVE_CALLS.collect():
+        for sample in metric.samples:
+            if sample.labels == {"business_id": business_id}:
+                return sample.value
+    return None
+
+
+@pytest.fixture
+def active_calls_gauge() -> Generator[Gauge, None, None]:
+    """Yield a cached ACTIVE_CALLS child, removing the label afterwards."""
+    yield ACTIVE_CALLS.labels(business_id="test")
+    ACTIVE_CALLS.remove("test")
 
 
 class TestActiveCallsGauge:
     """Tests for ACTIVE_CALLS gauge."""
 
-    def test_active_calls_increment(self) -> None:
+    def test_active_calls_increment(self, active_calls_gauge: Gauge) -> None:
         """Test incrementing active calls gauge."""
-        initial = ACTIVE_CALLS.labels(business_id="test")._value.get()
+        initial = _active_calls_value("test")
+        assert initial is not None
 
-        ACTIVE_CALLS.labels(business_id="test").inc()
-        after_inc = ACTIVE_CALLS.labels(business_id="test")._value.get()
+        active_calls_gauge.inc()
 
-        assert after_inc == initial + 1
+        assert _active_calls_value("test") == initial + 1
 
-        # Cleanup
-        ACTIVE_CALLS.labels(business_id="test").dec()
-
-    def test_active_calls_decrement(self) -> None:
+    def test_active_calls_decrement(self, active_calls_gauge: Gauge) -> None:
         """Test decrementing active calls gauge."""
-        ACTIVE_CALLS.labels(business_id="test2").set(5)
-
-        ACTIVE_CALLS.labels(business_id="test2").dec()
-        value = ACTIVE_CALLS.labels(business_id="test2")._value.get()
+        active_calls_gauge.set(5)
 
-        assert value == 4
+        active_calls_gauge.dec()
 
-        # Cleanup
-        ACTIVE_CALLS.labels(business_id="test2").set(0)
+        assert _active_calls_value("test") == 4
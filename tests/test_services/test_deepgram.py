@@ -1,13 +1,15 @@
 """Tests for Deepgram STT service."""
 
-import os
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.services.stt.deepgram import LANGUAGE_MAP, DeepgramService
 from src.services.stt.protocol import DetectedLanguage, TranscriptChunk
 
+# Name -> member mapping for lookup tables (a plain dict lookup).
+_LANG = DetectedLanguage.__members__
+
 
 class TestTranscriptChunk:
     """Tests for TranscriptChunk dataclass."""
@@ -22,7 +24,7 @@ class TestTranscriptChunk:
         assert chunk.text == "Hello"
         assert chunk.is_final is True
         assert chunk.confidence == 0.95
-        assert chunk.detected_language == DetectedLanguage.UNKNOWN
+        assert chunk.detected_language is DetectedLanguage.UNKNOWN
 
     def test_chunk_with_language(self) -> None:
         """Test chunk with detected language."""
@@ -31,7 +33,7 @@ class TestTranscriptChunk:
             is_final=True,
             detected_language=DetectedLanguage.HINDI,
         )
-        assert chunk.detected_language == DetectedLanguage.HINDI
+        assert chunk.detected_language is DetectedLanguage.HINDI
 
     def test_chunk_with_timing(self) -> None:
         """Test chunk with timing info."""
@@ -57,34 +59,46 @@ class TestTranscriptChunk:
 class TestLanguageMapping:
     """Tests for language code mapping."""
 
-    def test_hindi_mapping(self) -> None:
-        """Test Hindi language code mapping."""
-        assert LANGUAGE_MAP["hi"] == DetectedLanguage.HINDI
-
-    def test_english_mapping(self) -> None:
-        """Test English language code mappings."""
-        assert LANGUAGE_MAP["en"] == DetectedLanguage.ENGLISH
-        assert LANGUAGE_MAP["en-US"] == DetectedLanguage.ENGLISH
-        assert LANGUAGE_MAP["en-IN"] == DetectedLanguage.ENGLISH
-
-    def test_hinglish_mapping(self) -> None:
-        """Test Hinglish (romanized Hindi) mapping."""
-        assert LANGUAGE_MAP["hi-Latn"] == DetectedLanguage.HINGLISH
-
-    def test_unknown_language(self) -> None:
-        """Test unknown language returns UNKNOWN."""
-        unknown = LANGUAGE_MAP.get("fr", DetectedLanguage.UNKNOWN)
-        assert unknown == DetectedLanguage.UNKNOWN
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            ("hi", _LANG["HINDI"]),
+            ("en", _LANG["ENGLISH"]),
+            ("en-US", _LANG["ENGLISH"]),
+            ("en-IN", _LANG["ENGLISH"]),
+            ("hi-Latn", _LANG["HINGLISH"]),  # Romanized Hindi
+            ("fr", _LANG["UNKNOWN"]),  # Unmapped codes fall back to UNKNOWN
+        ],
+    )
+    def test_language_mapping(self, code: str, expected: DetectedLanguage) -> None:
+        """Test language code lookup with the UNKNOWN fallback."""
+        assert LANGUAGE_MAP.get(code, DetectedLanguage.UNKNOWN) is expected
+
+    def test_language_map_exact(self) -> None:
+        """Test LANGUAGE_MAP has exactly the expected entries."""
+        assert LANGUAGE_MAP == {
+            "hi": DetectedLanguage.HINDI,
+            "en": DetectedLanguage.ENGLISH,
+            "en-US": DetectedLanguage.ENGLISH,
+            "en-IN": DetectedLanguage.ENGLISH,
+            "hi-Latn": DetectedLanguage.HINGLISH,
+        }
 
 
 class TestDeepgramService:
     """Tests for DeepgramService."""
 
-    @pytest.fixture
-    def service(self, settings_factory) -> DeepgramService:
-        """Create service instance with real Settings."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, settings_factory) -> DeepgramService:
+        """Create one service instance with real Settings for the whole class."""
         return DeepgramService(settings=settings_factory())
 
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, service: DeepgramService) -> None:
+        """Drop any client a previous test created so lazy-init starts fresh."""
+        service._client = None
+
     def test_init_default_model(self, service: DeepgramService) -> None:
         """Test service initializes with default nova-2 model."""
         assert service._model == "nova-2"
@@ -111,18 +125,32 @@ class TestDeepgramService:
         client2 = service.client
         assert client1 is client2
 
-    @pytest.mark.asyncio
     async def test_close(self, service: DeepgramService) -> None:
         """Test close clears client."""
         _ = service.client
         await service.close()
         assert service._client is None
 
-    @pytest.mark.asyncio
     async def test_health_check_success(self, service: DeepgramService) -> None:
-        """Test health check succeeds with valid client."""
+        """Test health check builds the real SDK client from the dummy API key.
+
+        health_check only constructs the client and makes no network call,
+        so nothing needs mocking.
+        """
+        from deepgram import DeepgramClient
+
         result = await service.health_check()
+
         assert result is True
+        assert isinstance(service._client, DeepgramClient)
+
+    async def test_health_check_failure(self, service: DeepgramService) -> None:
+        """Test health check reports False when the SDK client can't be built."""
+        with patch("deepgram.DeepgramClient", side_effect=ValueError("bad key")):
+            result = await service.health_check()
+
+        assert result is False
+        assert service._client is None
 
 
 class TestDetectedLanguageEnum:
@@ -130,40 +158,14 @@ class TestDetectedLanguageEnum:
 
     def test_language_values(self) -> None:
         """Test language enum values."""
-        assert DetectedLanguage.HINDI.value == "hi"
-        assert DetectedLanguage.ENGLISH.value == "en"
-        assert DetectedLanguage.HINGLISH.value == "hi-Latn"
-        assert DetectedLanguage.UNKNOWN.value == "unknown"
+        assert {m.name: m.value for m in DetectedLanguage} == {
+            "HINDI": "hi",
+            "ENGLISH": "en",
+            "HINGLISH": "hi-Latn",
+            "UNKNOWN": "unknown",
+        }
 
     def test_language_is_string_enum(self) -> None:
         """Test language enum is string-based."""
         assert str(DetectedLanguage.HINDI) == "DetectedLanguage.HINDI"
         assert DetectedLanguage.HINDI == "hi"
-
-
-def _has_deepgram_key() -> bool:
-    return bool(os.environ.get("DEEPGRAM_API_KEY"))
-
-
-@pytest.mark.skipif(
-    not _has_deepgram_key() or not os.environ.get("DEEPGRAM_TEST_AUDIO"),
-    reason="DEEPGRAM_API_KEY or DEEPGRAM_TEST_AUDIO not set",
-)
-class TestTranscriptionIntegration:
-    """Integration tests for Deepgram transcription (env-gated)."""
-
-    @pytest.fixture
-    def service(self, settings_factory) -> DeepgramService:
-        settings = settings_factory(deepgram_api_key=os.environ["DEEPGRAM_API_KEY"])
-        return DeepgramService(settings=settings)
-
-    @pytest.mark.asyncio
-    async def test_transcribe_file(self, service: DeepgramService) -> None:
-        """Test transcribing a real audio file."""
-        audio_path = Path(os.environ["DEEPGRAM_TEST_AUDIO"])
-        audio_data = audio_path.read_bytes()
-
-        transcript, metadata = await service.transcribe_file(audio_data)
-
-        assert isinstance(transcript, str)
-        assert metadata.model == service._model
@@ -0,0 +1,44 @@
+"""Integration tests for Deepgram transcription (env-gated).
+
+Only collected when DEEPGRAM_API_KEY and DEEPGRAM_TEST_AUDIO are set; see
+collect_ignore in tests/conftest.py. The skipif below covers running this
+file directly.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.services.stt.deepgram import DeepgramService
+
+pytestmark = [
+    pytest.mark.external,
+    pytest.mark.skipif(
+        not (os.environ.get("DEEPGRAM_API_KEY") and os.environ.get("DEEPGRAM_TEST_AUDIO")),
+        reason="DEEPGRAM_API_KEY or DEEPGRAM_TEST_AUDIO not set",
+    ),
+]
+
+
+class TestTranscriptionIntegration:
+    """Integration tests for Deepgram transcription (env-gated)."""
+
+    @pytest.fixture
+    def service(self, settings_factory) -> DeepgramService:
+        settings = settings_factory(deepgram_api_key=os.environ["DEEPGRAM_API_KEY"])
+        return DeepgramService(settings=settings)
+
+    async def test_transcribe_file(self, service: DeepgramService) -> None:
+        """Test transcribing a real audio file."""
+        audio_path = Path(os.environ["DEEPGRAM_TEST_AUDIO"])
+        audio_data = audio_path.read_bytes()
+
+        transcript, metadata = await service.transcribe_file(audio_data)
+
+        assert isinstance(transcript, str)
+        assert metadata.model == service._model
+
+    async def test_health_check_with_real_client(self, service: DeepgramService) -> None:
+        """Test health check builds a real SDK client from the configured key."""
+        assert await service.health_check() is True
@@ -2,190 +2,229 @@
 
 from __future__ import annotations
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from datetime import date, datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from zoneinfo import ZoneInfo
 
 import pytest
 
+from src.prompts.extraction import ExtractionPromptBuilder
+from src.prompts.restaurant import RestaurantPromptBuilder
 from src.services.llm.extractor import (
     ExtractedReservation,
     ExtractionIntent,
     ReservationExtractor,
 )
+from src.services.llm.protocol import ConversationContext, Message, Role
 
+# Fixed reference date so date arithmetic in these tests never straddles midnight.
+_FROZEN_TODAY = date(2026, 2, 1)
 
-class TestExtractedReservation:
-    """Tests for ExtractedReservation dataclass."""
+# Name -> member mapping for lookup tables (a plain dict lookup).
+_INTENT = ExtractionIntent.__members__
 
-    def test_missing_fields_for_reservation_intent(self) -> None:
-        """Test that missing fields are calculated for MAKE_RESERVATION."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-        )
+# Failure raised by the stubbed LLM in error-path tests
+_API_ERROR = RuntimeError("API error")
 
-        assert "date" in extraction.missing_fields
-        assert "time" in extraction.missing_fields
-        assert "name" in extraction.missing_fields
-        assert "party_size" not in extraction.missing_fields
+# Prior turns for history-summary tests; Message is frozen, so the tuple is shareable.
+_HISTORY = (
+    Message(role=Role.USER, content="Table chahiye"),
+    Message(role=Role.ASSISTANT, content="Kitne logon ke liye?"),
+)
 
-    def test_is_complete_when_all_fields_present(self) -> None:
-        """Test is_complete returns True when all required fields present."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date.today() + timedelta(days=1),
-            reservation_time="19:00",
-            customer_name="Sharma",
-            confidence=0.9,
-        )
+# Standard business rules for validation tests; read-only so it can be shared.
+_BUSINESS_RULES = MappingProxyType(
+    {
+        "max_phone_party_size": 10,
+        "min_advance_minutes": 30,
+        "max_advance_days": 30,
+    }
+)
 
-        assert extraction.is_complete is True
-        assert len(extraction.missing_fields) == 0
 
-    def test_is_complete_false_when_missing_fields(self) -> None:
-        """Test is_complete returns False when fields missing."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-        )
+def _make_extractor(today: date = _FROZEN_TODAY) -> ReservationExtractor:
+    """Build an extractor for parsing/validation tests, which never touch the LLM."""
+    extractor = ReservationExtractor()
+    extractor._today = today
+    return extractor
 
-        assert extraction.is_complete is False
-        assert len(extraction.missing_fields) > 0
-
-    def test_inquiry_intent_has_no_missing_fields(self) -> None:
-        """Test that INQUIRY intent doesn't require reservation fields."""
-        extraction = ExtractedReservation(
-            intent=ExtractionIntent.INQUIRY,
-        )
 
-        assert len(extraction.missing_fields) == 0
-        assert extraction.is_complete is True
+class _AsyncStub:
+    """Awaitable call recorder used in place of AsyncMock for extract_json.
 
-    def test_merge_preserves_existing_values(self) -> None:
-        """Test merge keeps existing values when new ones are None."""
-        existing = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            party_size=4,
-            reservation_date=date.today(),
-        )
+    Supports the subset of the AsyncMock surface these tests use:
+    return_value, side_effect, call_args and assert_called_once().
+    """
 
-        new = ExtractedReservation(
-            intent=ExtractionIntent.CHITCHAT,  # Should not override
-            reservation_time="19:00",
-            customer_name="Sharma",
-        )
+    __slots__ = ("return_value", "side_effect", "calls")
 
-        merged = existing.merge_with(new)
+    def __init__(self) -> None:
+        self.return_value: Any = None
+        self.side_effect: BaseException | None = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
 
-        assert merged.intent == ExtractionIntent.MAKE_RESERVATION  # Preserved
-        assert merged.party_size == 4  # Preserved
-        assert merged.reservation_date == date.today()  # Preserved
-        assert merged.reservation_time == "19:00"  # New
-        assert merged.customer_name == "Sharma"  # New
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
 
-    def test_merge_takes_new_non_chitchat_intent(self) -> None:
-        """Test merge takes new intent if it's not CHITCHAT."""
-        existing = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-        )
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+        return self.calls[-1] if self.calls else None
 
-        new = ExtractedReservation(
-            intent=ExtractionIntent.CANCEL_RESERVATION,
-        )
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected 1 call, got {len(self.calls)}"
 
-        merged = existing.merge_with(new)
-        assert merged.intent == ExtractionIntent.CANCEL_RESERVATION
 
-    def test_merge_keeps_higher_confidence(self) -> None:
-        """Test merge keeps the higher confidence value."""
-        existing = ExtractedReservation(
-            intent=ExtractionIntent.MAKE_RESERVATION,
-            confidence=0.5,
-        )
+class TestExtractedReservation:
+    """Tests for ExtractedReservation dataclass."""
 
-        new = ExtractedReservation(
-            intent=ExtractionIntent.CHITCHAT,
-            confidence=0.8,
-        )
+    @pytest.mark.parametrize(
+        ("fields", "expected_missing", "expected_complete"),
+        [
+            pytest.param(
+                {"intent": ExtractionIntent.MAKE_RESERVATION, "party_size": 4},
+                ["date", "time", "name"],
+                False,
+                id="reservation_missing_fields",
+            ),
+            pytest.param(
+                {
+                    "intent": ExtractionIntent.MAKE_RESERVATION,
+                    "party_size": 4,
+                    "reservation_date": _FROZEN_TODAY + timedelta(days=1),
+                    "reservation_time": "19:00",
+                    "customer_name": "Sharma",
+                    "confidence": 0.9,
+                },
+                [],
+                True,
+                id="reservation_all_fields",
+            ),
+            pytest.param(
+                {"intent": ExtractionIntent.INQUIRY},
+                [],
+                True,
+                id="inquiry_needs_no_fields",
+            ),
+        ],
+    )
+    def test_missing_fields_and_is_complete(
+        self,
+        fields: dict[str, Any],
+        expected_missing: list[str],
+        expected_complete: bool,
+    ) -> None:
+        """Test missing_fields and is_complete for each intent/field combination."""
+        extraction = ExtractedReservation(**fields)
+
+        assert extraction.missing_fields == expected_missing
+        assert extraction.is_complete is expected_complete
+
+    @pytest.mark.parametrize(
+        ("existing_fields", "new_fields", "expected"),
+        [
+            pytest.param(
+                {
+                    "intent": ExtractionIntent.MAKE_RESERVATION,
+                    "party_size": 4,
+                    "reservation_date": _FROZEN_TODAY,
+                },
+                {
+                    "intent": ExtractionIntent.CHITCHAT,  # Should not override
+                    "reservation_time": "19:00",
+                    "customer_name": "Sharma",
+                },
+                {
+                    "intent": ExtractionIntent.MAKE_RESERVATION,  # Preserved
+                    "party_size": 4,  # Preserved
+                    "reservation_date": _FROZEN_TODAY,  # Preserved
+                    "reservation_time": "19:00",  # New
+                    "customer_name": "Sharma",  # New
+                },
+                id="preserves_existing_values",
+            ),
+            pytest.param(
+                {"intent": ExtractionIntent.MAKE_RESERVATION},
+                {"intent": ExtractionIntent.CANCEL_RESERVATION},
+                {"intent": ExtractionIntent.CANCEL_RESERVATION},
+                id="takes_new_non_chitchat_intent",
+            ),
+            pytest.param(
+                {"intent": ExtractionIntent.MAKE_RESERVATION, "confidence": 0.5},
+                {"intent": ExtractionIntent.CHITCHAT, "confidence": 0.8},
+                {"confidence": 0.8},
+                id="keeps_higher_confidence",
+            ),
+        ],
+    )
+    def test_merge_with(
+        self,
+        existing_fields: dict[str, Any],
+        new_fields: dict[str, Any],
+        expected: dict[str, Any],
+    ) -> None:
+        """Test merge_with combines fields from both extractions."""
+        existing = ExtractedReservation(**existing_fields)
+        new = ExtractedReservation(**new_fields)
 
         merged = existing.merge_with(new)
-        assert merged.confidence == 0.8
+
+        for field, value in expected.items():
+            assert getattr(merged, field) == value, field
 
 
 class TestReservationExtractorParsing:
     """Tests for extraction parsing logic (no LLM calls)."""
 
-    @pytest.fixture
-    def extractor(self) -> ReservationExtractor:
-        """Create extractor with mocked LLM."""
-        mock_llm = MagicMock()
-        return ReservationExtractor(llm_service=mock_llm)
-
-    def test_parse_date_today(self, extractor: ReservationExtractor) -> None:
-        """Test parsing 'today'."""
-        extractor._today = date(2026, 2, 1)
-
-        result = extractor._parse_date("today")
-        assert result == date(2026, 2, 1)
-
-    def test_parse_date_tomorrow(self, extractor: ReservationExtractor) -> None:
-        """Test parsing 'tomorrow' / 'kal'."""
-        extractor._today = date(2026, 2, 1)
-
-        assert extractor._parse_date("tomorrow") == date(2026, 2, 2)
-        assert extractor._parse_date("kal") == date(2026, 2, 2)
-
-    def test_parse_date_day_after_tomorrow(self, extractor: ReservationExtractor) -> None:
-        """Test parsing 'parson' (day after tomorrow)."""
-        extractor._today = date(2026, 2, 1)
-
-        assert extractor._parse_date("parson") == date(2026, 2, 3)
-        assert extractor._parse_date("day after tomorrow") == date(2026, 2, 3)
-
-    def test_parse_date_iso_format(self, extractor: ReservationExtractor) -> None:
-        """Test parsing YYYY-MM-DD format."""
-        result = extractor._parse_date("2026-02-15")
-        assert result == date(2026, 2, 15)
-
-    def test_parse_date_dd_mm_yyyy_format(self, extractor: ReservationExtractor) -> None:
-        """Test parsing DD-MM-YYYY format."""
-        result = extractor._parse_date("15-02-2026")
-        assert result == date(2026, 2, 15)
-
-    def test_parse_date_invalid_returns_none(self, extractor: ReservationExtractor) -> None:
-        """Test invalid date strings return None."""
-        assert extractor._parse_date("invalid") is None
-        assert extractor._parse_date("") is None
-        assert extractor._parse_date(None) is None
-
-    def test_parse_time_hh_mm_format(self, extractor: ReservationExtractor) -> None:
-        """Test parsing HH:MM format."""
-        assert extractor._parse_time("19:00") == "19:00"
-        assert extractor._parse_time("7:30") == "07:30"
-        assert extractor._parse_time("20:30") == "20:30"
-
-    def test_parse_time_single_number_assumes_pm(self, extractor: ReservationExtractor) -> None:
-        """Test single hour assumes PM for 1-6."""
-        # Hours 1-6 should be converted to PM (add 12)
-        assert extractor._parse_time("3") == "15:00"
-        assert extractor._parse_time("6") == "18:00"
-
-        # Hours 7+ stay as-is (already PM hours for dining)
-        assert extractor._parse_time("7") == "07:00"  # 7 stays as 07
-        assert extractor._parse_time("8") == "08:00"
-
-    def test_parse_time_invalid_returns_none(self, extractor: ReservationExtractor) -> None:
-        """Test invalid time strings return None."""
-        assert extractor._parse_time("invalid") is None
-        assert extractor._parse_time("") is None
-        assert extractor._parse_time(None) is None
-        assert extractor._parse_time("shaam") is None  # Too vague
-
-    def test_parse_extraction_full_response(self, extractor: ReservationExtractor) -> None:
+    @pytest.mark.parametrize(
+        ("date_str", "expected"),
+        [
+            ("today", _FROZEN_TODAY),
+            ("tomorrow", date(2026, 2, 2)),
+            ("kal", date(2026, 2, 2)),
+            ("parson", date(2026, 2, 3)),  # Day after tomorrow
+            ("day after tomorrow", date(2026, 2, 3)),
+            ("2026-02-15", date(2026, 2, 15)),  # YYYY-MM-DD
+            ("15-02-2026", date(2026, 2, 15)),  # DD-MM-YYYY
+            ("invalid", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_parse_date(self, date_str: str | None, expected: date | None) -> None:
+        """Test parsing relative and absolute date strings."""
+        extractor = _make_extractor()
+        assert extractor._parse_date(date_str) == expected
+
+    @pytest.mark.parametrize(
+        ("time_str", "expected"),
+        [
+            ("19:00", "19:00"),
+            ("7:30", "07:30"),
+            ("20:30", "20:30"),
+            # Hours 1-6 are converted to PM (add 12)
+            ("3", "15:00"),
+            ("6", "18:00"),
+            # Hours 7+ stay as-is
+            ("7", "07:00"),
+            ("8", "08:00"),
+            ("invalid", None),
+            ("", None),
+            (None, None),
+            ("shaam", None),  # Too vague
+        ],
+    )
+    def test_parse_time(self, time_str: str | None, expected: str | None) -> None:
+        """Test parsing HH:MM and bare-hour time strings."""
+        extractor = _make_extractor()
+        assert extractor._parse_time(time_str) == expected
+
+    def test_parse_extraction_full_response(self) -> None:
         """Test parsing a complete extraction response."""
-        extractor._today = date(2026, 2, 1)
-
+        extractor = _make_extractor()
         raw = {
             "intent": "MAKE_RESERVATION",
             "party_size": 4,
@@ -198,7 +237,7 @@ class TestReservationExtractorParsing:
 
         result = extractor._parse_extraction(raw)
 
-        assert result.intent == ExtractionIntent.MAKE_RESERVATION
+        assert result.intent is ExtractionIntent.MAKE_RESERVATION
         assert result.party_size == 4
         assert result.reservation_date == date(2026, 2, 2)
         assert result.reservation_time == "19:00"
@@ -207,8 +246,9 @@ class TestReservationExtractorParsing:
         assert result.confidence == 0.9
         assert result.is_complete is True
 
-    def test_parse_extraction_partial_response(self, extractor: ReservationExtractor) -> None:
+    def test_parse_extraction_partial_response(self) -> None:
         """Test parsing a partial extraction response."""
+        extractor = _make_extractor()
         raw = {
             "intent": "MAKE_RESERVATION",
             "party_size": 4,
@@ -220,7 +260,7 @@ class TestReservationExtractorParsing:
 
         result = extractor._parse_extraction(raw)
 
-        assert result.intent == ExtractionIntent.MAKE_RESERVATION
+        assert result.intent is ExtractionIntent.MAKE_RESERVATION
         assert result.party_size == 4
         assert result.reservation_date is None
         assert result.reservation_time is None
@@ -229,26 +269,31 @@ class TestReservationExtractorParsing:
         assert "time" in result.missing_fields
         assert "name" in result.missing_fields
 
-    def test_parse_extraction_intent_variations(self, extractor: ReservationExtractor) -> None:
+    @pytest.mark.parametrize(
+        ("intent_str", "expected"),
+        [
+            ("MAKE_RESERVATION", _INTENT["MAKE_RESERVATION"]),
+            ("MODIFY", _INTENT["MODIFY_RESERVATION"]),
+            ("MODIFY_RESERVATION", _INTENT["MODIFY_RESERVATION"]),
+            ("CANCEL", _INTENT["CANCEL_RESERVATION"]),
+            ("INQUIRY", _INTENT["INQUIRY"]),
+            ("CHITCHAT", _INTENT["CHITCHAT"]),
+            ("OPERATOR", _INTENT["OPERATOR_REQUEST"]),
+            ("unknown", _INTENT["CHITCHAT"]),  # Default
+        ],
+    )
+    def test_parse_extraction_intent_variations(
+        self, intent_str: str, expected: ExtractionIntent
+    ) -> None:
         """Test parsing different intent strings."""
-        test_cases = [
-            ("MAKE_RESERVATION", ExtractionIntent.MAKE_RESERVATION),
-            ("MODIFY", ExtractionIntent.MODIFY_RESERVATION),
-            ("MODIFY_RESERVATION", ExtractionIntent.MODIFY_RESERVATION),
-            ("CANCEL", ExtractionIntent.CANCEL_RESERVATION),
-            ("INQUIRY", ExtractionIntent.INQUIRY),
-            ("CHITCHAT", ExtractionIntent.CHITCHAT),
-            ("OPERATOR", ExtractionIntent.OPERATOR_REQUEST),
-            ("unknown", ExtractionIntent.CHITCHAT),  # Default
-        ]
-
-        for intent_str, expected in test_cases:
-            raw = {"intent": intent_str, "confidence": 0.5}
-            result = extractor._parse_extraction(raw)
-            assert result.intent == expected, f"Failed for {intent_str}"
-
-    def test_parse_extraction_clamps_confidence(self, extractor: ReservationExtractor) -> None:
+        extractor = _make_extractor()
+        raw = {"intent": intent_str, "confidence": 0.5}
+        result = extractor._parse_extraction(raw)
+        assert result.intent is expected
+
+    def test_parse_extraction_clamps_confidence(self) -> None:
         """Test that confidence is clamped to 0-1 range."""
+        extractor = _make_extractor()
         raw = {"intent": "CHITCHAT", "confidence": 1.5}
         result = extractor._parse_extraction(raw)
         assert result.confidence == 1.0
@@ -257,18 +302,16 @@ class TestReservationExtractorParsing:
         result = extractor._parse_extraction(raw)
         assert result.confidence == 0.0
 
-    def test_parse_extraction_strips_whitespace_from_name(
-        self, extractor: ReservationExtractor
-    ) -> None:
+    def test_parse_extraction_strips_whitespace_from_name(self) -> None:
         """Test that name is stripped of whitespace."""
+        extractor = _make_extractor()
         raw = {"intent": "MAKE_RESERVATION", "name": "  Sharma ji  ", "confidence": 0.5}
         result = extractor._parse_extraction(raw)
         assert result.customer_name == "Sharma ji"
 
-    def test_parse_extraction_empty_name_becomes_none(
-        self, extractor: ReservationExtractor
-    ) -> None:
+    def test_parse_extraction_empty_name_becomes_none(self) -> None:
         """Test that empty/whitespace name becomes None."""
+        extractor = _make_extractor()
         raw = {"intent": "MAKE_RESERVATION", "name": "   ", "confidence": 0.5}
         result = extractor._parse_extraction(raw)
         assert result.customer_name is None
@@ -277,89 +320,62 @@ class TestReservationExtractorParsing:
 class TestReservationExtractorValidation:
     """Tests for validation logic."""
 
-    @pytest.fixture
-    def extractor(self) -> ReservationExtractor:
-        """Create extractor with mocked LLM."""
-        mock_llm = MagicMock()
-        extractor = ReservationExtractor(llm_service=mock_llm)
-        extractor._today = date(2026, 2, 1)
-        return extractor
-
-    @pytest.fixture
-    def business_rules(self) -> dict:
-        """Standard business rules for testing."""
-        return {
-            "max_phone_party_size": 10,
-            "min_advance_minutes": 30,
-            "max_advance_days": 30,
-        }
-
-    @pytest.mark.asyncio
-    async def test_validate_party_size_exceeds_max(
-        self, extractor: ReservationExtractor, business_rules: dict
-    ) -> None:
+    async def test_validate_party_size_exceeds_max(self) -> None:
         """Test validation fails when party size exceeds max."""
+        extractor = _make_extractor()
         extraction = ExtractedReservation(
             intent=ExtractionIntent.MAKE_RESERVATION,
             party_size=15,
         )
 
-        errors = await extractor.validate(extraction, business_rules)
+        errors = await extractor.validate(extraction, _BUSINESS_RULES)
 
         assert len(errors) == 1
         assert "15" in errors[0]
         assert "10" in errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_party_size_zero(
-        self, extractor: ReservationExtractor, business_rules: dict
-    ) -> None:
+    async def test_validate_party_size_zero(self) -> None:
         """Test validation fails for party size < 1."""
+        extractor = _make_extractor()
         extraction = ExtractedReservation(
             intent=ExtractionIntent.MAKE_RESERVATION,
             party_size=0,
         )
 
-        errors = await extractor.validate(extraction, business_rules)
+        errors = await extractor.validate(extraction, _BUSINESS_RULES)
 
         assert len(errors) == 1
         assert "at least 1" in errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_past_date(
-        self, extractor: ReservationExtractor, business_rules: dict
-    ) -> None:
+    async def test_validate_past_date(self) -> None:
         """Test validation fails for past dates."""
+        extractor = _make_extractor()
         extraction = ExtractedReservation(
             intent=ExtractionIntent.MAKE_RESERVATION,
             reservation_date=date(2026, 1, 15),  # Past date
         )
 
-        errors = await extractor.validate(extraction, business_rules)
+        errors = await extractor.validate(extraction, _BUSINESS_RULES)
 
         assert len(errors) == 1
         assert "past" in errors[0].lower()
 
-    @pytest.mark.asyncio
-    async def test_validate_date_too_far_in_future(
-        self, extractor: ReservationExtractor, business_rules: dict
-    ) -> None:
+    async def test_validate_date_too_far_in_future(self) -> None:
         """Test validation fails for dates too far in advance."""
+        extractor = _make_extractor()
         extraction = ExtractedReservation(
             intent=ExtractionIntent.MAKE_RESERVATION,
             reservation_date=date(2026, 4, 1),  # >30 days
         )
 
-        errors = await extractor.validate(extraction, business_rules)
+        errors = await extractor.validate(extraction, _BUSINESS_RULES)
 
         assert len(errors) == 1
         assert "30 days" in errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_valid_extraction(
-        self, extractor: ReservationExtractor, business_rules: dict
-    ) -> None:
+    async def test_validate_valid_extraction(self) -> None:
         """Test validation passes for valid extraction."""
+        extractor = _make_extractor()
         extraction = ExtractedReservation(
             intent=ExtractionIntent.MAKE_RESERVATION,
             party_size=4,
@@ -369,7 +385,7 @@ class TestReservationExtractorValidation:
             confidence=0.9,
         )
 
-        errors = await extractor.validate(extraction, business_rules)
+        errors = await extractor.validate(extraction, _BUSINESS_RULES)
 
         assert len(errors) == 0
 
@@ -377,23 +393,30 @@ class TestReservationExtractorValidation:
 class TestReservationExtractorLLMCalls:
     """Tests for extract() method with mocked LLM."""
 
-    @pytest.fixture
-    def mock_llm(self) -> MagicMock:
-        """Create mock LLM service."""
-        mock = MagicMock()
-        mock.extract_json = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm: MagicMock) -> ReservationExtractor:
-        """Create extractor with mocked LLM."""
-        extractor = ReservationExtractor(llm_service=mock_llm)
-        extractor._today = date(2026, 2, 1)
-        return extractor
-
-    @pytest.mark.asyncio
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_llm(cls) -> SimpleNamespace:
+        """Create one stand-in LLM service for the whole class.
+
+        extract() only calls extract_json, so a namespace holding the stub
+        is enough; no MagicMock child tree is needed.
+        """
+        return SimpleNamespace(extract_json=_AsyncStub())
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def extractor(cls, mock_llm: SimpleNamespace) -> ReservationExtractor:
+        """Create one extractor with mocked LLM for the whole class."""
+        return ReservationExtractor(llm_service=mock_llm)  # type: ignore[arg-type]
+
+    @pytest.fixture(autouse=True)
+    def _reset_llm(self, extractor: ReservationExtractor, mock_llm: SimpleNamespace) -> None:
+        """Give each test a fresh extract_json and the same reference date."""
+        mock_llm.extract_json = _AsyncStub()
+        extractor._today = _FROZEN_TODAY
+
     async def test_extract_calls_llm_with_correct_format(
-        self, extractor: ReservationExtractor, mock_llm: MagicMock
+        self, extractor: ReservationExtractor, mock_llm: SimpleNamespace
     ) -> None:
         """Test extract() calls LLM with properly formatted messages."""
         mock_llm.extract_json.return_value = {
@@ -417,9 +440,8 @@ class TestReservationExtractorLLMCalls:
         assert call_args[1]["role"] == "user"
         assert "4 logon" in call_args[1]["content"]
 
-    @pytest.mark.asyncio
     async def test_extract_returns_parsed_result(
-        self, extractor: ReservationExtractor, mock_llm: MagicMock
+        self, extractor: ReservationExtractor, mock_llm: SimpleNamespace
     ) -> None:
         """Test extract() returns properly parsed ExtractedReservation."""
         mock_llm.extract_json.return_value = {
@@ -437,18 +459,17 @@ class TestReservationExtractorLLMCalls:
         )
 
         assert result is not None
-        assert result.intent == ExtractionIntent.MAKE_RESERVATION
+        assert result.intent is ExtractionIntent.MAKE_RESERVATION
         assert result.party_size == 4
         assert result.reservation_date == date(2026, 2, 2)
         assert result.reservation_time == "19:00"
         assert result.customer_name == "Sharma"
 
-    @pytest.mark.asyncio
     async def test_extract_returns_none_on_error(
-        self, extractor: ReservationExtractor, mock_llm: MagicMock
+        self, extractor: ReservationExtractor, mock_llm: SimpleNamespace
     ) -> None:
         """Test extract() returns None when LLM call fails."""
-        mock_llm.extract_json.side_effect = Exception("API error")
+        mock_llm.extract_json.side_effect = _API_ERROR
 
         result = await extractor.extract(
             user_message="Table book karna hai",
@@ -457,27 +478,19 @@ class TestReservationExtractorLLMCalls:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_extract_includes_history_summary(
-        self, extractor: ReservationExtractor, mock_llm: MagicMock
+        self, extractor: ReservationExtractor, mock_llm: SimpleNamespace
     ) -> None:
         """Test extract() includes conversation history in prompt."""
-        from src.services.llm.protocol import Message, Role
-
         mock_llm.extract_json.return_value = {
             "intent": "MAKE_RESERVATION",
             "confidence": 0.5,
         }
 
-        history = [
-            Message(role=Role.USER, content="Table chahiye"),
-            Message(role=Role.ASSISTANT, content="Kitne logon ke liye?"),
-        ]
-
         await extractor.extract(
             user_message="4 log",
             assistant_response="Theek hai, 4 log. Kab?",
-            conversation_history=history,
+            conversation_history=list(_HISTORY),
         )
 
         call_args = mock_llm.extract_json.call_args[0][0]
@@ -492,8 +505,6 @@ class TestPromptBuilders:
 
     def test_extraction_prompt_builder_basic(self) -> None:
         """Test ExtractionPromptBuilder creates valid messages."""
-        from src.prompts.extraction import ExtractionPromptBuilder
-
         builder = ExtractionPromptBuilder()
         messages = builder.build_extraction_prompt(
             user_message="Table book karna hai",
@@ -507,8 +518,6 @@ class TestPromptBuilders:
 
     def test_extraction_prompt_builder_with_history(self) -> None:
         """Test ExtractionPromptBuilder includes history summary."""
-        from src.prompts.extraction import ExtractionPromptBuilder
-
         builder = ExtractionPromptBuilder()
         messages = builder.build_extraction_prompt(
             user_message="4 log",
@@ -520,12 +529,6 @@ class TestPromptBuilders:
 
     def test_restaurant_prompt_builder_includes_examples(self) -> None:
         """Test RestaurantPromptBuilder includes few-shot examples."""
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-
-        from src.prompts.restaurant import RestaurantPromptBuilder
-        from src.services.llm.protocol import ConversationContext
-
         builder = RestaurantPromptBuilder()
         context = ConversationContext(
             business_name="Test Restaurant",
@@ -544,8 +547,6 @@ class TestPromptBuilders:
 
     def test_restaurant_prompt_builder_returns_examples_list(self) -> None:
         """Test get_few_shot_examples returns list of examples."""
-        from src.prompts.restaurant import RestaurantPromptBuilder
-
         builder = RestaurantPromptBuilder()
         examples = builder.get_few_shot_examples()
 
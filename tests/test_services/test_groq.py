@@ -1,12 +1,14 @@
 """Tests for Groq LLM service."""
 
 import os
+from dataclasses import replace
 from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 
 from src.services.llm.groq import GroqService
-from src.services.llm.protocol import ConversationContext, Message, Role
+from src.services.llm.protocol import ConversationContext, Message, Role, StreamMetadata
 from src.services.llm.token_counter import estimate_llama_tokens
 
 
@@ -60,6 +62,12 @@ class TestTokenEstimation:
         tokens = estimate_llama_tokens(text)
         assert tokens > 0
 
+    def test_estimate_tokens_devanagari_block_boundaries(self):
+        """Test only U+0900-U+097F count as Devanagari (Bengali U+0980 does not)."""
+        text = "\u0900\u097f\u0980ab"
+        # 2 Devanagari / 2 + 3 other / 4 = 1.75 -> int(1.925) + 1
+        assert estimate_llama_tokens(text) == 2
+
     def test_estimate_tokens_long_text(self):
         """Test longer text estimation."""
         text = "a" * 1000
@@ -67,6 +75,15 @@ class TestTokenEstimation:
         # ~1000/4 * 1.1 + 1 = ~276
         assert 250 <= tokens <= 300
 
+    def test_estimate_tokens_repeated_text_is_cached(self):
+        """Test re-estimating identical text is served from the cache."""
+        text = "नमस्ते, do logon ke liye table chahiye"
+        first = estimate_llama_tokens(text)
+        hits = estimate_llama_tokens.cache_info().hits
+
+        assert estimate_llama_tokens("".join(text)) == first
+        assert estimate_llama_tokens.cache_info().hits == hits + 1
+
 
 class TestGroqService:
     """Test suite for GroqService."""
@@ -99,6 +116,27 @@ class TestGroqService:
         assert "25" in prompt
         assert "available seats" in prompt.lower()
 
+    def test_build_system_prompt_stable_prefix(self, groq_service, sample_context):
+        """Test business sections precede per-turn details and survive a clock change."""
+        later = replace(sample_context, current_datetime=datetime(2026, 3, 1, 20, 30))
+
+        prompt = groq_service._build_system_prompt(sample_context)
+        later_prompt = groq_service._build_system_prompt(later)
+
+        prefix = prompt.split("## Current Information")[0]
+        assert "## Operating Hours" in prefix
+        assert later_prompt.startswith(prefix)
+        assert later_prompt != prompt
+
+    def test_build_system_prompt_dict_hours(self, groq_service, sample_context):
+        """Test structured hours saved via the admin API render without error."""
+        sample_context.operating_hours = {
+            "monday": {"open": "11:00", "close": "22:00", "overnight": False},
+        }
+        prompt = groq_service._build_system_prompt(sample_context)
+
+        assert "- Monday: {'open': '11:00', 'close': '22:00', 'overnight': False}" in prompt
+
     def test_build_system_prompt_with_menu(self, groq_service, sample_context):
         """Test system prompt with menu summary."""
         sample_context.menu_summary = "Momos, Thukpa, Chow Mein"
@@ -132,13 +170,52 @@ class TestGroqService:
         assert api_messages[2]["role"] == "assistant"
         assert api_messages[3]["role"] == "user"
 
-    @pytest.mark.asyncio
     async def test_close(self, groq_service):
         """Test client cleanup."""
         _ = groq_service.client
         await groq_service.close()
         assert groq_service._client is None
 
+    async def test_warmup_swallows_connection_errors(self, groq_service):
+        """Test warmup logs and ignores connection failures."""
+
+        async def fail_list():
+            raise ConnectionError("unreachable")
+
+        groq_service._client = SimpleNamespace(
+            with_options=lambda **_: SimpleNamespace(models=SimpleNamespace(list=fail_list))
+        )
+
+        await groq_service.warmup()  # Must not raise
+
+    async def test_stream_skips_role_only_chunk(self, groq_service):
+        """Test streaming yields only text and records first token latency."""
+        chunks = [_chunk(None), _chunk("Namaste"), _chunk(" ji", finish_reason="stop")]
+
+        async def fake_stream():
+            for chunk in chunks:
+                yield chunk
+
+        async def create(**_):
+            return fake_stream()
+
+        groq_service._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        metadata = StreamMetadata()
+
+        tokens = [t async for t in groq_service._stream_with_metadata([], 10, 0.0, metadata)]
+
+        assert tokens == ["Namaste", " ji"]
+        assert metadata.first_token_ms is not None
+        assert metadata.finish_reason == "stop"
+
+
+def _chunk(content: str | None, finish_reason: str | None = None) -> SimpleNamespace:
+    """Minimal stand-in for a streamed ChatCompletionChunk."""
+    choice = SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+    return SimpleNamespace(choices=[choice], x_groq=None)
+
 
 def _has_groq_key() -> bool:
     return bool(os.environ.get("GROQ_API_KEY"))
@@ -157,7 +234,6 @@ class TestGroqIntegration:
     def context(self, sample_context):
         return sample_context
 
-    @pytest.mark.asyncio
     async def test_stream_chat(self, service, context, sample_messages):
         """Test streaming chat returns content and metadata."""
         generator, metadata = await service.stream_chat(
@@ -177,7 +253,6 @@ class TestGroqIntegration:
 
         await service.close()
 
-    @pytest.mark.asyncio
     async def test_health_check(self, service):
         """Test health check hits Groq API."""
         result = await service.health_check()
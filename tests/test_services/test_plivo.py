@@ -1,5 +1,7 @@
 """Tests for Plivo telephony service."""
 
+from xml.etree import ElementTree
+
 import pytest
 
 from src.services.telephony.plivo import (
@@ -131,6 +133,16 @@ class TestPlivoService:
         assert 'contentType="audio/basic"' in xml
         assert 'streamTimeout="1800"' in xml
 
+    def test_generate_xml_escapes_text(self, service: PlivoService) -> None:
+        """Test URLs and spoken text are XML-escaped and the result parses."""
+        stream_xml = service.generate_stream_xml("wss://example.com/ws?call=1&token=a<b")
+        speak_xml = service.generate_speak_xml('Tom & "Jerry" <3')
+
+        assert "call=1&amp;token=a&lt;b" in stream_xml
+        assert "Tom &amp; \"Jerry\" &lt;3" in speak_xml
+        for xml in (stream_xml, speak_xml):
+            ElementTree.fromstring(xml.encode("utf-8"))
+
     def test_generate_speak_xml(self, service: PlivoService) -> None:
         """Test speak XML generation."""
         xml = service.generate_speak_xml("Namaste!")
@@ -207,6 +219,14 @@ class TestAudioConversion:
         # Resampled should be approximately half the size
         assert len(resampled) < len(audio)
 
+    def test_resample_downsample_exact_length(self) -> None:
+        """Test 16-bit mono downsampling yields exactly rate-scaled samples."""
+        audio = bytes(3200)  # 1600 samples = 100 ms at 16kHz
+
+        resampled = resample_audio(audio, 16000, 8000)
+
+        assert len(resampled) == 1600  # 800 samples
+
     def test_compute_audio_energy_silence(self) -> None:
         """Test energy computation on silence."""
         silence = bytes(1600)  # 800 samples of silence
@@ -32,7 +32,6 @@ class TestTokenBucketRateLimiter:
         # Should not raise
         limiter.record_usage(50)
 
-    @pytest.mark.asyncio
     async def test_acquire_within_limit(self, limiter):
         """Test acquiring tokens within limit."""
         start = time.monotonic()
@@ -42,14 +41,12 @@ class TestTokenBucketRateLimiter:
         # Should not wait
         assert elapsed < 0.1
 
-    @pytest.mark.asyncio
     async def test_acquire_depletes_bucket(self, limiter):
         """Test that acquiring depletes the bucket."""
         await limiter.acquire(80)
         # Bucket should have ~20 tokens left
         assert limiter.available_tokens < 30
 
-    @pytest.mark.asyncio
     async def test_multiple_acquires(self, limiter):
         """Test multiple sequential acquires."""
         await limiter.acquire(30)
@@ -59,7 +56,6 @@ class TestTokenBucketRateLimiter:
         # Should have depleted most of the bucket
         assert limiter.available_tokens < 20
 
-    @pytest.mark.asyncio
     async def test_request_limit_tracking(self, limiter):
         """Test that request limits are tracked."""
         # Make several small requests
@@ -85,34 +81,43 @@ class TestTokenBucketRateLimiter:
     def test_refill_over_time(self, limiter):
         """Test that bucket refills based on elapsed time."""
         # Manually deplete the bucket
-        limiter._token_bucket = 50.0
+        limiter._token_bucket = 40
 
         # Simulate 30 seconds passing
-        limiter._last_refill = time.monotonic() - 30
+        limiter._token_clock_ns = time.monotonic_ns() - 30 * 1_000_000_000
 
-        # Refill should add ~50 tokens (30s = 0.5min, 0.5 * 100 = 50)
+        # Refill should add exactly 50 tokens (30s = 0.5min, 0.5 * 100 = 50)
         limiter._refill()
 
-        assert limiter._token_bucket > 90  # Should be near 100
+        assert limiter._token_bucket == 90
+
+    def test_refill_keeps_partial_token_on_clock(self, limiter):
+        """Test time short of a whole token is carried to the next refill."""
+        limiter._token_bucket = 10
+        clock = time.monotonic_ns() - limiter._ns_per_token * 5 // 2  # 2.5 tokens ago
+        limiter._token_clock_ns = clock
+
+        limiter._refill()
+
+        assert limiter._token_bucket == 12
+        assert limiter._token_clock_ns == clock + 2 * limiter._ns_per_token
 
 
 class TestRateLimiterEdgeCases:
     """Edge case tests for rate limiter."""
 
-    @pytest.mark.asyncio
     async def test_zero_tokens_request(self):
         """Test requesting zero tokens."""
         limiter = TokenBucketRateLimiter(tokens_per_minute=100, requests_per_minute=10)
         await limiter.acquire(0)
         # Should complete without waiting
 
-    @pytest.mark.asyncio
     async def test_bucket_cap(self):
         """Test that bucket doesn't exceed max capacity."""
         limiter = TokenBucketRateLimiter(tokens_per_minute=100, requests_per_minute=10)
 
         # Simulate long time passing
-        limiter._last_refill = time.monotonic() - 600  # 10 minutes ago
+        limiter._token_clock_ns = time.monotonic_ns() - 600 * 1_000_000_000  # 10 minutes ago
         limiter._refill()
 
         # Should be capped at max
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
-import pytest
-
 from src.db.models import IssueCategory
 from src.services.analysis.transcript_crew import (
     MAX_TRANSCRIPT_CHARS,
@@ -16,6 +14,9 @@ from src.services.analysis.transcript_crew import (
     TranscriptReviewResult,
 )
 
+# Twice the turn limit, built once at import
+_LONG_TRANSCRIPT = "\n".join(f"Turn {i}: Some text" for i in range(MAX_TRANSCRIPT_TURNS * 2))
+
 # =============================================================================
 # TranscriptReviewResult Tests
 # =============================================================================
@@ -100,6 +101,7 @@ class TestTranscriptTruncation:
         result_lines = result.split("\n")
         # Account for truncation marker line
         assert len(result_lines) <= MAX_TRANSCRIPT_TURNS + 1
+        assert result_lines[1:] == lines[-MAX_TRANSCRIPT_TURNS:]
 
     def test_truncate_by_chars(self):
         """Transcripts exceeding char limit are truncated."""
@@ -297,6 +299,15 @@ class TestJsonExtraction:
         assert result is not None
         assert result["category_summary"]["has_knowledge_gap"] is True
 
+    def test_skips_invalid_brace_before_json(self):
+        """A stray brace before the JSON object is skipped."""
+        crew = TranscriptAnalysisCrew()
+
+        text = 'Note {not json} then {"quality_score": 2}'
+        result = crew._extract_json_from_text(text)
+
+        assert result == {"quality_score": 2}
+
     def test_no_json_returns_none(self):
         """Text without JSON returns None."""
         crew = TranscriptAnalysisCrew()
@@ -324,7 +335,6 @@ class TestJsonExtraction:
 class TestCrewAnalysisMocked:
     """Integration tests with mocked LLM."""
 
-    @pytest.mark.asyncio
     async def test_analyze_transcript_returns_result_on_llm_failure(self):
         """Analysis returns default result when LLM fails."""
         with (
@@ -342,14 +352,10 @@ class TestCrewAnalysisMocked:
         assert result.issues == []
         assert result.suggestions == []
 
-    @pytest.mark.asyncio
     async def test_analyze_transcript_truncates_long_input(self):
         """Long transcripts are truncated before analysis."""
         crew = TranscriptAnalysisCrew()
 
-        # Create very long transcript
-        long_transcript = "\n".join([f"Turn {i}: Some text" for i in range(100)])
-
         # Track what gets passed to _create_review_task
         original_create = crew._create_review_task
         captured_transcript = None
@@ -363,7 +369,7 @@ class TestCrewAnalysisMocked:
             patch.object(crew, "_create_review_task", side_effect=mock_create),
             patch("crewai.Crew.kickoff", side_effect=Exception("Skip")),
         ):
-            await crew.analyze_transcript(long_transcript, "Test")
+            await crew.analyze_transcript(_LONG_TRANSCRIPT, "Test")
 
         # Verify truncation was applied
         if captured_transcript:
@@ -7,7 +7,9 @@ Tests are organized as:
 
 import math
 import os
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -25,7 +27,12 @@ from src.services.tts.piper import DEFAULT_PIPER_MODEL, PIPER_SAMPLE_RATE, Piper
 from src.services.tts.protocol import AudioChunk, SynthesisMetadata
 from src.services.tts.resampler import AudioResampler
 
+# Two 16-bit PCM samples (0 and 1) and 100ms of 8kHz 16-bit silence
+_TWO_SAMPLES = b"\x00\x00\x01\x00"
+_SILENCE_100MS = bytes(1600)
 
+
+@lru_cache(maxsize=64)
 def generate_sine_wave(
     frequency: float,
     duration_seconds: float,
@@ -34,6 +41,8 @@ def generate_sine_wave(
 ) -> bytes:
     """Generate a sine wave as 16-bit PCM bytes.
 
+    Cached: tests reuse a few tones, and the returned bytes are immutable.
+
     Args:
         frequency: Frequency in Hz
         duration_seconds: Duration of the audio
@@ -51,13 +60,21 @@ def generate_sine_wave(
     return int16_signal.tobytes()
 
 
+def expected_resampled_bytes(audio_data: bytes, source_rate: int, target_rate: int) -> int:
+    """Byte length soxr produces when resampling 16-bit mono PCM.
+
+    soxr rounds the output sample count to the nearest integer.
+    """
+    return round(len(audio_data) // 2 * target_rate / source_rate) * 2
+
+
 class TestAudioChunk:
     """Tests for AudioChunk dataclass."""
 
     def test_create_chunk(self) -> None:
         """Test basic chunk creation."""
-        chunk = AudioChunk(audio_bytes=b"\x00\x00\x01\x00")
-        assert chunk.audio_bytes == b"\x00\x00\x01\x00"
+        chunk = AudioChunk(audio_bytes=_TWO_SAMPLES)
+        assert chunk.audio_bytes == _TWO_SAMPLES
         assert chunk.sample_rate == 8000
         assert chunk.sample_width == 2
         assert chunk.channels == 1
@@ -66,7 +83,7 @@ class TestAudioChunk:
     def test_chunk_with_duration(self) -> None:
         """Test chunk with duration."""
         chunk = AudioChunk(
-            audio_bytes=b"\x00" * 1600,
+            audio_bytes=_SILENCE_100MS,
             sample_rate=8000,
             duration_ms=100.0,
             is_final=True,
@@ -81,6 +98,13 @@ class TestAudioChunk:
         after = datetime.now(UTC)
         assert before <= chunk.timestamp <= after
 
+    def test_chunk_timestamp_ns(self) -> None:
+        """Test chunk records creation time as epoch nanoseconds."""
+        before = time.time_ns()
+        chunk = AudioChunk(audio_bytes=b"\x00")
+        assert before <= chunk.timestamp_ns <= time.time_ns()
+        assert chunk.timestamp.tzinfo is UTC
+
     def test_chunk_is_frozen(self) -> None:
         """Test chunk is immutable."""
         chunk = AudioChunk(audio_bytes=b"\x00")
@@ -164,6 +188,22 @@ class TestTTSExceptions:
         assert isinstance(exc, TTSServiceError)
 
 
+# AudioResampler holds only its rates, so tests that just read or resample
+# can share one instance per rate pair.
+
+
+@pytest.fixture(scope="module")
+def resampler_22k_8k() -> AudioResampler:
+    """Piper rate (22050Hz) to telephony."""
+    return AudioResampler(PIPER_SAMPLE_RATE, 8000)
+
+
+@pytest.fixture(scope="module")
+def resampler_8k_8k() -> AudioResampler:
+    """Same-rate passthrough."""
+    return AudioResampler(8000, 8000)
+
+
 class TestAudioResampler:
     """Pure unit tests for AudioResampler with generated PCM data."""
 
@@ -173,47 +213,38 @@ class TestAudioResampler:
         assert resampler._source_rate == 22050
         assert resampler._target_rate == 8000
 
-    def test_ratio(self) -> None:
+    def test_ratio(self, resampler_22k_8k: AudioResampler) -> None:
         """Test resampling ratio calculation."""
-        resampler = AudioResampler(22050, 8000)
-        assert abs(resampler.ratio - (8000 / 22050)) < 0.001
+        assert abs(resampler_22k_8k.ratio - (8000 / 22050)) < 0.001
 
-    def test_needs_resampling_true(self) -> None:
+    def test_needs_resampling_true(self, resampler_22k_8k: AudioResampler) -> None:
         """Test needs_resampling when rates differ."""
-        resampler = AudioResampler(22050, 8000)
-        assert resampler.needs_resampling is True
+        assert resampler_22k_8k.needs_resampling is True
 
-    def test_needs_resampling_false(self) -> None:
+    def test_needs_resampling_false(self, resampler_8k_8k: AudioResampler) -> None:
         """Test needs_resampling when rates match."""
-        resampler = AudioResampler(8000, 8000)
-        assert resampler.needs_resampling is False
+        assert resampler_8k_8k.needs_resampling is False
 
-    @pytest.mark.asyncio
-    async def test_resample_passthrough_same_rate(self) -> None:
+    async def test_resample_passthrough_same_rate(self, resampler_8k_8k: AudioResampler) -> None:
         """Test resample passes through when rates match."""
-        resampler = AudioResampler(8000, 8000)
         audio_data = generate_sine_wave(440, 0.1, 8000)
-        result = await resampler.resample(audio_data)
+        result = await resampler_8k_8k.resample(audio_data)
         assert result == audio_data
 
-    @pytest.mark.asyncio
-    async def test_resample_empty_data(self) -> None:
+    async def test_resample_empty_data(self, resampler_22k_8k: AudioResampler) -> None:
         """Test resample handles empty data."""
-        resampler = AudioResampler(22050, 8000)
-        result = await resampler.resample(b"")
+        result = await resampler_22k_8k.resample(b"")
         assert result == b""
 
-    @pytest.mark.asyncio
-    async def test_resample_downsamples_sine_wave(self) -> None:
+    async def test_resample_downsamples_sine_wave(self, resampler_22k_8k: AudioResampler) -> None:
         """Test downsampling a 440Hz sine wave preserves duration."""
         source_rate = 22050
         target_rate = 8000
         duration = 1.0
 
-        resampler = AudioResampler(source_rate, target_rate)
         audio_data = generate_sine_wave(440, duration, source_rate)
 
-        result = await resampler.resample(audio_data)
+        result = await resampler_22k_8k.resample(audio_data)
 
         # Check output duration is preserved (within 2%)
         input_samples = len(audio_data) // 2
@@ -224,29 +255,22 @@ class TestAudioResampler:
 
         assert abs(output_duration - input_duration) < 0.02  # 20ms tolerance
 
-    @pytest.mark.asyncio
-    async def test_resample_reduces_byte_count(self) -> None:
+    def test_resample_reduces_byte_count(self, resampler_22k_8k: AudioResampler) -> None:
         """Test resampling reduces data size proportionally."""
         source_rate = 22050
         target_rate = 8000
 
-        resampler = AudioResampler(source_rate, target_rate)
-        audio_data = generate_sine_wave(440, 1.0, source_rate)
-
-        result = await resampler.resample(audio_data)
+        audio_data = generate_sine_wave(440, 0.1, source_rate)
 
-        # Output should be roughly (target_rate / source_rate) of input size
-        expected_ratio = target_rate / source_rate
-        actual_ratio = len(result) / len(audio_data)
+        result = resampler_22k_8k.resample_sync(audio_data)
 
-        assert abs(actual_ratio - expected_ratio) < 0.05  # 5% tolerance
+        assert len(result) == expected_resampled_bytes(audio_data, source_rate, target_rate)
 
-    def test_resample_sync_with_real_audio(self) -> None:
+    def test_resample_sync_with_real_audio(self, resampler_22k_8k: AudioResampler) -> None:
         """Test synchronous resample with generated audio."""
-        resampler = AudioResampler(22050, 8000)
         audio_data = generate_sine_wave(440, 0.1, 22050)  # 100ms of 440Hz
 
-        result = resampler.resample_sync(audio_data)
+        result = resampler_22k_8k.resample_sync(audio_data)
 
         # Output should be smaller than input
         assert len(result) < len(audio_data)
@@ -254,39 +278,22 @@ class TestAudioResampler:
         # Check it's valid int16 data (even number of bytes)
         assert len(result) % 2 == 0
 
-    def test_resample_sync_passthrough(self) -> None:
+    def test_resample_sync_passthrough(self, resampler_8k_8k: AudioResampler) -> None:
         """Test sync resample passes through when rates match."""
-        resampler = AudioResampler(8000, 8000)
         audio_data = generate_sine_wave(440, 0.1, 8000)
-        result = resampler.resample_sync(audio_data)
+        result = resampler_8k_8k.resample_sync(audio_data)
         assert result == audio_data
 
-    @pytest.mark.asyncio
-    async def test_resample_piper_to_telephony(self) -> None:
-        """Test resampling from Piper rate (22050) to telephony (8000)."""
-        resampler = AudioResampler(PIPER_SAMPLE_RATE, 8000)
-        # 500ms of audio
-        audio_data = generate_sine_wave(880, 0.5, PIPER_SAMPLE_RATE)
-
-        result = await resampler.resample(audio_data)
-
-        # Verify output is valid
-        assert len(result) > 0
-        assert len(result) % 2 == 0  # Valid int16
-
-        # Check approximate duration preservation
-        output_samples = len(result) // 2
-        output_duration = output_samples / 8000
-        assert 0.48 < output_duration < 0.52  # Within 20ms of 500ms
-
-    @pytest.mark.asyncio
-    async def test_resample_edge_to_telephony(self) -> None:
-        """Test resampling from Edge TTS rate (24000) to telephony (8000)."""
-        resampler = AudioResampler(EDGE_SAMPLE_RATE, 8000)
+    @pytest.mark.parametrize(
+        "source_rate", [PIPER_SAMPLE_RATE, EDGE_SAMPLE_RATE], ids=["piper", "edge"]
+    )
+    def test_resample_to_telephony(self, source_rate: int) -> None:
+        """Test resampling from each TTS engine rate to telephony (8000)."""
+        resampler = AudioResampler(source_rate, 8000)
         # 500ms of audio
-        audio_data = generate_sine_wave(880, 0.5, EDGE_SAMPLE_RATE)
+        audio_data = generate_sine_wave(880, 0.5, source_rate)
 
-        result = await resampler.resample(audio_data)
+        result = resampler.resample_sync(audio_data)
 
         # Verify output is valid
         assert len(result) > 0
@@ -301,17 +308,28 @@ class TestAudioResampler:
 class TestPiperTTSServiceUnit:
     """Unit tests for PiperTTSService (no model required)."""
 
-    @pytest.fixture
-    def base_settings(self, settings_factory):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def base_settings(cls, settings_factory):
         return settings_factory(
             piper_voice=DEFAULT_PIPER_MODEL,
             piper_model_path=None,
             tts_target_sample_rate=8000,
         )
 
-    def test_init_default_voice(self, base_settings) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, base_settings) -> PiperTTSService:
+        """One service for the tests that only inspect it or cache a resampler."""
+        return PiperTTSService(settings=base_settings)
+
+    @pytest.fixture(autouse=True)
+    def _reset_resampler(self, service: PiperTTSService) -> None:
+        """Drop any resampler cached by a previous test."""
+        service._resampler = None
+
+    def test_init_default_voice(self, service: PiperTTSService) -> None:
         """Test service initializes with default Hindi voice."""
-        service = PiperTTSService(settings=base_settings)
         assert service._voice_name == DEFAULT_PIPER_MODEL
 
     def test_init_custom_model_path(self, base_settings) -> None:
@@ -330,15 +348,13 @@ class TestPiperTTSServiceUnit:
         service = PiperTTSService(settings=settings)
         assert service._model_path == Path("/custom/path/model.onnx")
 
-    def test_init_default_model_path(self, base_settings) -> None:
+    def test_init_default_model_path(self, service: PiperTTSService) -> None:
         """Test default model path construction."""
-        service = PiperTTSService(settings=base_settings)
         expected = Path(f"data/models/piper/{DEFAULT_PIPER_MODEL}.onnx")
         assert service._model_path == expected
 
-    def test_voice_lazy_init(self, base_settings) -> None:
+    def test_voice_lazy_init(self, service: PiperTTSService) -> None:
         """Test voice is None until accessed."""
-        service = PiperTTSService(settings=base_settings)
         assert service._tts is None
 
     def test_voice_model_not_found(self, base_settings) -> None:
@@ -351,7 +367,6 @@ class TestPiperTTSServiceUnit:
             _ = service.tts
         assert "TTS model not found" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_close_clears_resources(self, base_settings) -> None:
         """Test close clears internal resources."""
         service = PiperTTSService(settings=base_settings)
@@ -360,31 +375,26 @@ class TestPiperTTSServiceUnit:
         assert service._tts is None
         assert service._resampler is None
 
-    @pytest.mark.asyncio
-    async def test_health_check_no_model(self, base_settings) -> None:
+    async def test_health_check_no_model(self, service: PiperTTSService) -> None:
         """Test health check fails when model missing."""
-        service = PiperTTSService(settings=base_settings)
         result = await service.health_check()
         assert result is False
 
-    def test_get_resampler_creates_new(self, base_settings) -> None:
+    def test_get_resampler_creates_new(self, service: PiperTTSService) -> None:
         """Test _get_resampler creates new resampler."""
-        service = PiperTTSService(settings=base_settings)
         resampler = service._get_resampler(8000)
         assert resampler is not None
         assert resampler._target_rate == 8000
         assert resampler._source_rate == PIPER_SAMPLE_RATE
 
-    def test_get_resampler_caches(self, base_settings) -> None:
+    def test_get_resampler_caches(self, service: PiperTTSService) -> None:
         """Test _get_resampler caches resampler."""
-        service = PiperTTSService(settings=base_settings)
         resampler1 = service._get_resampler(8000)
         resampler2 = service._get_resampler(8000)
         assert resampler1 is resampler2
 
-    def test_get_resampler_different_rate(self, base_settings) -> None:
+    def test_get_resampler_different_rate(self, service: PiperTTSService) -> None:
         """Test _get_resampler creates new for different rate."""
-        service = PiperTTSService(settings=base_settings)
         resampler1 = service._get_resampler(8000)
         resampler2 = service._get_resampler(16000)
         assert resampler1 is not resampler2
@@ -394,9 +404,8 @@ class TestPiperTTSServiceUnit:
         """Test Piper sample rate constant."""
         assert PIPER_SAMPLE_RATE == 22050
 
-    def test_cancel_method_exists(self, base_settings) -> None:
+    def test_cancel_method_exists(self, service: PiperTTSService) -> None:
         """Test cancel method for barge-in support."""
-        service = PiperTTSService(settings=base_settings)
         # Should not raise
         service.cancel()
 
@@ -413,25 +422,37 @@ class TestPiperTTSServiceUnit:
 class TestEdgeTTSServiceUnit:
     """Unit tests for EdgeTTSService (no network required)."""
 
-    @pytest.fixture
-    def settings_enabled(self, settings_factory):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def settings_enabled(cls, settings_factory):
         return settings_factory(
             edge_tts_enabled=True,
             edge_tts_voice=EDGE_HINDI_VOICE,
             tts_target_sample_rate=8000,
         )
 
-    @pytest.fixture
-    def settings_disabled(self, settings_factory):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def settings_disabled(cls, settings_factory):
         return settings_factory(
             edge_tts_enabled=False,
             edge_tts_voice=EDGE_HINDI_VOICE,
             tts_target_sample_rate=8000,
         )
 
-    def test_init_default_voice(self, settings_enabled) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, settings_enabled) -> EdgeTTSService:
+        """One enabled service for the tests that only inspect it or cache a resampler."""
+        return EdgeTTSService(settings=settings_enabled)
+
+    @pytest.fixture(autouse=True)
+    def _reset_resampler(self, service: EdgeTTSService) -> None:
+        """Drop any resampler cached by a previous test."""
+        service._resampler = None
+
+    def test_init_default_voice(self, service: EdgeTTSService) -> None:
         """Test service initializes with default Hindi voice."""
-        service = EdgeTTSService(settings=settings_enabled)
         assert service._voice == EDGE_HINDI_VOICE
         assert service._voice == "hi-IN-SwaraNeural"
 
@@ -444,7 +465,6 @@ class TestEdgeTTSServiceUnit:
         """Test Edge TTS sample rate constant."""
         assert EDGE_SAMPLE_RATE == 24000
 
-    @pytest.mark.asyncio
     async def test_synthesize_stream_fails_when_disabled(self, settings_disabled) -> None:
         """Test synthesize_stream raises when Edge TTS disabled."""
         service = EdgeTTSService(settings=settings_disabled)
@@ -452,7 +472,6 @@ class TestEdgeTTSServiceUnit:
             await service.synthesize_stream("test")
         assert "Edge TTS is disabled" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_close_clears_resources(self, settings_enabled) -> None:
         """Test close clears internal resources."""
         service = EdgeTTSService(settings=settings_enabled)
@@ -460,31 +479,27 @@ class TestEdgeTTSServiceUnit:
         await service.close()
         assert service._resampler is None
 
-    @pytest.mark.asyncio
     async def test_health_check_disabled(self, settings_disabled) -> None:
         """Test health check returns False when disabled."""
         service = EdgeTTSService(settings=settings_disabled)
         result = await service.health_check()
         assert result is False
 
-    def test_get_resampler_creates_new(self, settings_enabled) -> None:
+    def test_get_resampler_creates_new(self, service: EdgeTTSService) -> None:
         """Test _get_resampler creates new resampler."""
-        service = EdgeTTSService(settings=settings_enabled)
         resampler = service._get_resampler(8000)
         assert resampler is not None
         assert resampler._target_rate == 8000
         assert resampler._source_rate == EDGE_SAMPLE_RATE
 
-    def test_get_resampler_caches(self, settings_enabled) -> None:
+    def test_get_resampler_caches(self, service: EdgeTTSService) -> None:
         """Test _get_resampler caches resampler."""
-        service = EdgeTTSService(settings=settings_enabled)
         resampler1 = service._get_resampler(8000)
         resampler2 = service._get_resampler(8000)
         assert resampler1 is resampler2
 
-    def test_cancel_method_exists(self, settings_enabled) -> None:
+    def test_cancel_method_exists(self, service: EdgeTTSService) -> None:
         """Test cancel method for barge-in support."""
-        service = EdgeTTSService(settings=settings_enabled)
         # Should not raise
         service.cancel()
 
@@ -507,14 +522,14 @@ def _piper_model_ready() -> bool:
 class TestPiperTTSIntegration:
     """Integration tests for Piper TTS (requires PIPER_MODEL_PATH env var)."""
 
-    @pytest.fixture
-    def service(self, settings_factory) -> PiperTTSService:
-        """Create service with real model path from env."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, settings_factory) -> PiperTTSService:
+        """Create one service (and loaded model) with real model path from env."""
         model_path = os.environ.get("PIPER_MODEL_PATH")
         settings = settings_factory(piper_model_path=model_path)
         return PiperTTSService(settings=settings, model_path=model_path)
 
-    @pytest.mark.asyncio
     async def test_synthesize_hindi_text(self, service: PiperTTSService) -> None:
         """Test synthesizing Hindi text."""
         text = "नमस्ते"
@@ -525,7 +540,6 @@ class TestPiperTTSIntegration:
         assert metadata.output_duration_ms > 0
         assert metadata.model == "piper"
 
-    @pytest.mark.asyncio
     async def test_synthesize_stream_yields_chunks(
         self, service: PiperTTSService
     ) -> None:
@@ -533,16 +547,19 @@ class TestPiperTTSIntegration:
         text = "Hello, how are you?"
         generator, metadata = await service.synthesize_stream(text)
 
-        chunks = []
+        # Consume like a real streaming sender: keep only the latest chunk
+        count = 0
+        last_chunk: AudioChunk | None = None
         async for chunk in generator:
-            chunks.append(chunk)
             assert isinstance(chunk, AudioChunk)
             assert len(chunk.audio_bytes) > 0
+            count += 1
+            last_chunk = chunk
 
-        assert len(chunks) > 0
-        assert chunks[-1].is_final is True
+        assert count > 0
+        assert last_chunk is not None
+        assert last_chunk.is_final is True
 
-    @pytest.mark.asyncio
     async def test_health_check_with_model(self, service: PiperTTSService) -> None:
         """Test health check passes with valid model."""
         result = await service.health_check()
@@ -557,9 +574,10 @@ class TestPiperTTSIntegration:
 class TestEdgeTTSIntegration:
     """Integration tests for Edge TTS (requires EDGE_TTS_ENABLED env var)."""
 
-    @pytest.fixture
-    def service(self, settings_factory) -> EdgeTTSService:
-        """Create service with Edge TTS enabled."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, settings_factory) -> EdgeTTSService:
+        """Create one service with Edge TTS enabled."""
         settings = settings_factory(
             edge_tts_enabled=True,
             edge_tts_voice=EDGE_HINDI_VOICE,
@@ -567,7 +585,6 @@ class TestEdgeTTSIntegration:
         )
         return EdgeTTSService(settings=settings)
 
-    @pytest.mark.asyncio
     async def test_synthesize_hindi_text(self, service: EdgeTTSService) -> None:
         """Test synthesizing Hindi text."""
         text = "नमस्ते"
@@ -578,7 +595,6 @@ class TestEdgeTTSIntegration:
         assert metadata.output_duration_ms > 0
         assert metadata.model == "edge-tts"
 
-    @pytest.mark.asyncio
     async def test_synthesize_stream_yields_chunks(
         self, service: EdgeTTSService
     ) -> None:
@@ -586,16 +602,19 @@ class TestEdgeTTSIntegration:
         text = "Hello, how are you?"
         generator, metadata = await service.synthesize_stream(text)
 
-        chunks = []
+        # Consume like a real streaming sender: keep only the latest chunk
+        count = 0
+        last_chunk: AudioChunk | None = None
         async for chunk in generator:
-            chunks.append(chunk)
             assert isinstance(chunk, AudioChunk)
             assert len(chunk.audio_bytes) > 0
+            count += 1
+            last_chunk = chunk
 
-        assert len(chunks) > 0
-        assert chunks[-1].is_final is True
+        assert count > 0
+        assert last_chunk is not None
+        assert last_chunk.is_final is True
 
-    @pytest.mark.asyncio
     async def test_health_check_enabled(self, service: EdgeTTSService) -> None:
         """Test health check passes when enabled."""
         result = await service.health_check()
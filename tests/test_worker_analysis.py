@@ -7,6 +7,10 @@ from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import (
     Business,
@@ -26,60 +30,79 @@ from src.services.analysis.transcript_crew import (
 # =============================================================================
 
 
-@pytest.fixture
-def sample_business():
-    """Create a sample business."""
-    return Business(
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_business(async_engine):
+    """Insert a sample business once for the module.
+
+    Committed ahead of every test's outer transaction, so per-test
+    rollbacks leave it in place; it is deleted on module teardown.
+    """
+    now = datetime.now(UTC)
+    business = Business(
         id="test_business",
         name="Test Business",
         phone_number="+911234567890",
         timezone="Asia/Kolkata",
         is_active=True,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=now,
+        updated_at=now,
     )
-
-
-@pytest.fixture
-def sample_call_log(sample_business):
-    """Create a sample call log with transcript."""
-    return CallLog(
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        session.add(business)
+        await session.commit()
+        yield business
+        await session.delete(business)
+        await session.commit()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_call_log(async_engine, sample_business):
+    """Insert a sample call log with transcript once for the module."""
+    call_log = CallLog(
         id=str(uuid4()),
         business_id=sample_business.id,
         duration_seconds=120,
         transcript="Bot: Namaste!\nCaller: Table book karna hai.\nBot: Kitne log?",
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
     )
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        session.add(call_log)
+        await session.commit()
+        yield call_log
+        await session.delete(call_log)
+        await session.commit()
+
+
+# Built once: tests only read it (the worker serializes it, never mutates it)
+_MOCK_CREW_RESULT = TranscriptReviewResult(
+    quality_score=4,
+    issues=[
+        ReviewedIssue(
+            category=IssueCategory.ux_issue,
+            description="Bot response was too brief",
+            severity=3,
+            context="Bot: Kitne log?",
+        ),
+    ],
+    suggestions=[
+        ImprovementSuggestionData(
+            category=IssueCategory.ux_issue,
+            title="Add more context to responses",
+            description="Include greeting and confirmation in responses",
+            priority=3,
+        ),
+    ],
+    has_unanswered_query=False,
+    has_knowledge_gap=False,
+    has_prompt_weakness=False,
+    has_ux_issue=True,
+    review_latency_ms=1500.0,
+)
 
 
 @pytest.fixture
 def mock_crew_result():
-    """Create a mock CrewAI analysis result."""
-    return TranscriptReviewResult(
-        quality_score=4,
-        issues=[
-            ReviewedIssue(
-                category=IssueCategory.ux_issue,
-                description="Bot response was too brief",
-                severity=3,
-                context="Bot: Kitne log?",
-            ),
-        ],
-        suggestions=[
-            ImprovementSuggestionData(
-                category=IssueCategory.ux_issue,
-                title="Add more context to responses",
-                description="Include greeting and confirmation in responses",
-                priority=3,
-            ),
-        ],
-        has_unanswered_query=False,
-        has_knowledge_gap=False,
-        has_prompt_weakness=False,
-        has_ux_issue=True,
-        review_latency_ms=1500.0,
-    )
+    """Return the shared mock CrewAI analysis result."""
+    return _MOCK_CREW_RESULT
 
 
 # =============================================================================
@@ -90,19 +113,11 @@ def mock_crew_result():
 class TestAnalysisJobPersistence:
     """Tests for analysis job creating DB records."""
 
-    @pytest.mark.asyncio
     async def test_creates_review_record(
-        self, async_session, sample_business, sample_call_log, mock_crew_result
+        self, async_session, sample_call_log, mock_crew_result
     ):
         """Analysis job creates TranscriptReview record."""
-        # Setup
-        async_session.add(sample_business)
-        async_session.add(sample_call_log)
-        await async_session.commit()
-
         # Mock the worker function components
-        from sqlalchemy import select
-
         with patch(
             "src.services.analysis.transcript_crew.TranscriptAnalysisCrew.analyze_transcript",
             new_callable=AsyncMock,
@@ -126,30 +141,18 @@ class TestAnalysisJobPersistence:
             async_session.add(review)
             await async_session.commit()
 
-        # Verify
-        result = await async_session.execute(
-            select(TranscriptReview).where(
-                TranscriptReview.call_log_id == sample_call_log.id
-            )
-        )
-        saved_review = result.scalar_one()
-
-        assert saved_review.quality_score == 4
-        assert saved_review.has_ux_issue is True
-        assert saved_review.has_knowledge_gap is False
-        assert "ux_issue" in saved_review.issues_json
+        # expire_on_commit=False keeps the committed attributes loaded, so
+        # verify on the object; the suggestion test re-selects from the DB.
+        assert review.quality_score == 4
+        assert review.has_ux_issue is True
+        assert review.has_knowledge_gap is False
+        assert "ux_issue" in review.issues_json
 
-    @pytest.mark.asyncio
     async def test_creates_suggestion_records(
-        self, async_session, sample_business, sample_call_log, mock_crew_result
+        self, async_session, sample_call_log, mock_crew_result
     ):
         """Analysis job creates ImprovementSuggestion records."""
-        # Setup
-        async_session.add(sample_business)
-        async_session.add(sample_call_log)
-        await async_session.commit()
-
-        from sqlalchemy import select
+        now = datetime.now(UTC)
 
         # Create review first
         review = TranscriptReview(
@@ -157,35 +160,37 @@ class TestAnalysisJobPersistence:
             call_log_id=sample_call_log.id,
             business_id=sample_call_log.business_id,
             quality_score=mock_crew_result.quality_score,
-            reviewed_at=datetime.now(UTC),
+            reviewed_at=now,
         )
         async_session.add(review)
-        await async_session.flush()
-
-        # Create suggestions
-        for suggestion in mock_crew_result.suggestions:
-            suggestion_record = ImprovementSuggestion(
-                id=str(uuid4()),
-                review_id=review.id,
-                business_id=sample_call_log.business_id,
-                category=suggestion.category,
-                title=suggestion.title,
-                description=suggestion.description,
-                priority=suggestion.priority,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            async_session.add(suggestion_record)
 
+        # Create suggestions; review.id is generated client-side, so no flush
+        # is needed before referencing it.
+        async_session.add_all(
+            [
+                ImprovementSuggestion(
+                    id=str(uuid4()),
+                    review_id=review.id,
+                    business_id=sample_call_log.business_id,
+                    category=suggestion.category,
+                    title=suggestion.title,
+                    description=suggestion.description,
+                    priority=suggestion.priority,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for suggestion in mock_crew_result.suggestions
+            ]
+        )
         await async_session.commit()
 
         # Verify
-        result = await async_session.execute(
+        result = await async_session.scalars(
             select(ImprovementSuggestion).where(
                 ImprovementSuggestion.review_id == review.id
             )
         )
-        saved_suggestions = result.scalars().all()
+        saved_suggestions = result.all()
 
         assert len(saved_suggestions) == 1
         assert saved_suggestions[0].title == "Add more context to responses"
@@ -200,16 +205,11 @@ class TestAnalysisJobPersistence:
 class TestDuplicateHandling:
     """Tests for handling duplicate analysis jobs."""
 
-    @pytest.mark.asyncio
     async def test_unique_constraint_prevents_duplicates(
-        self, async_session, sample_business, sample_call_log
+        self, async_session, sample_call_log
     ):
         """Unique constraint on call_log_id prevents duplicate reviews."""
-        from sqlalchemy.exc import IntegrityError
-
-        async_session.add(sample_business)
-        async_session.add(sample_call_log)
-        await async_session.commit()
+        now = datetime.now(UTC)
 
         # Create first review
         review1 = TranscriptReview(
@@ -217,7 +217,7 @@ class TestDuplicateHandling:
             call_log_id=sample_call_log.id,
             business_id=sample_call_log.business_id,
             quality_score=4,
-            reviewed_at=datetime.now(UTC),
+            reviewed_at=now,
         )
         async_session.add(review1)
         await async_session.commit()
@@ -228,7 +228,7 @@ class TestDuplicateHandling:
             call_log_id=sample_call_log.id,  # Same call_log_id
             business_id=sample_call_log.business_id,
             quality_score=3,
-            reviewed_at=datetime.now(UTC),
+            reviewed_at=now,
         )
         async_session.add(review2)
 
@@ -236,15 +236,11 @@ class TestDuplicateHandling:
         with pytest.raises(IntegrityError):
             await async_session.commit()
 
-    @pytest.mark.asyncio
     async def test_worker_handles_constraint_violation_gracefully(
-        self, async_session, sample_business, sample_call_log
+        self, async_session, sample_call_log
     ):
         """Worker handles unique constraint violation without raising."""
-        from sqlalchemy.exc import IntegrityError
-
-        async_session.add(sample_business)
-        async_session.add(sample_call_log)
+        now = datetime.now(UTC)
 
         # Create existing review
         existing_review = TranscriptReview(
@@ -252,7 +248,7 @@ class TestDuplicateHandling:
             call_log_id=sample_call_log.id,
             business_id=sample_call_log.business_id,
             quality_score=4,
-            reviewed_at=datetime.now(UTC),
+            reviewed_at=now,
         )
         async_session.add(existing_review)
         await async_session.commit()
@@ -263,20 +259,20 @@ class TestDuplicateHandling:
             call_log_id=sample_call_log.id,
             business_id=sample_call_log.business_id,
             quality_score=3,
-            reviewed_at=datetime.now(UTC),
+            reviewed_at=now,
         )
-        async_session.add(duplicate_review)
 
         constraint_violated = False
         try:
-            await async_session.flush()
+            # The SAVEPOINT flushes on exit and rolls back only the duplicate
+            async with async_session.begin_nested():
+                async_session.add(duplicate_review)
         except IntegrityError:
-            # Worker should rollback and return gracefully
             constraint_violated = True
-            await async_session.rollback()
 
         assert constraint_violated, "Should have raised IntegrityError"
-        # Note: After rollback, session state is reset - original review persists in DB
+        # The enclosing transaction is intact, so the original review remains
+        assert await async_session.get(TranscriptReview, existing_review.id) is not None
 
 
 # =============================================================================
@@ -287,36 +283,26 @@ class TestDuplicateHandling:
 class TestJobSkipping:
     """Tests for conditions that skip analysis."""
 
-    @pytest.mark.asyncio
     async def test_skips_if_no_transcript(self, async_session, sample_business):
         """Job skips if call log has no transcript."""
-        # Create call without transcript
+        # Create call without transcript; created_at comes from the model default
         call_log = CallLog(
             id=str(uuid4()),
             business_id=sample_business.id,
             duration_seconds=120,
             transcript=None,  # No transcript
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
         )
 
-        async_session.add(sample_business)
         async_session.add(call_log)
         await async_session.commit()
 
         # Verify skip condition
         assert call_log.transcript is None
 
-    @pytest.mark.asyncio
     async def test_skips_if_already_reviewed(
-        self, async_session, sample_business, sample_call_log
+        self, async_session, sample_call_log
     ):
         """Job skips if review already exists."""
-        from sqlalchemy import select
-
-        async_session.add(sample_business)
-        async_session.add(sample_call_log)
-
         # Create existing review
         existing_review = TranscriptReview(
             id=str(uuid4()),
@@ -329,12 +315,11 @@ class TestJobSkipping:
         await async_session.commit()
 
         # Check for existing review (as worker does)
-        result = await async_session.execute(
+        existing = await async_session.scalar(
             select(TranscriptReview).where(
                 TranscriptReview.call_log_id == sample_call_log.id
             )
         )
-        existing = result.scalar_one_or_none()
 
         # Worker would skip if this returns a result
         assert existing is not None